@@ -4,120 +4,68 @@ __contact__ = "@QP4RM"
 __description__ = "Advanced multilingual exception handler and translator for Python applications"
 __license__ = "MIT"
 
-from PolyglotX.languages.arbe import arbe
-from PolyglotX.languages.tr import tr
-from PolyglotX.languages.ja import ja
-from PolyglotX.languages.zh import zh
-from PolyglotX.languages.ku import ku
-from PolyglotX.languages.es import es
-from PolyglotX.languages.hi import hi
-from PolyglotX.languages.fr import fr
-from PolyglotX.languages.ru import ru
-from PolyglotX.languages.de import de
-from PolyglotX.languages.pt import pt
+from PolyglotX.utils.lazy_loader import lazy_exports
 
-from PolyglotX.core.exception_handler import (
-    ExceptionHandler,
-    GlobalExceptionHandler,
-    ErrorTranslator,
-    TracebackTranslator,
-    ContextualErrorHandler,
-    AsyncExceptionHandler,
-    ThreadSafeExceptionHandler,
-    ChainedExceptionHandler,
-    FilteredExceptionHandler,
-    LoggingExceptionHandler
-)
+_EXPORTS = {
+    'PolyglotX.languages.arbe': ['arbe'],
+    'PolyglotX.languages.tr': ['tr'],
+    'PolyglotX.languages.ja': ['ja'],
+    'PolyglotX.languages.zh': ['zh'],
+    'PolyglotX.languages.ku': ['ku'],
+    'PolyglotX.languages.es': ['es'],
+    'PolyglotX.languages.hi': ['hi'],
+    'PolyglotX.languages.fr': ['fr'],
+    'PolyglotX.languages.ru': ['ru'],
+    'PolyglotX.languages.de': ['de'],
+    'PolyglotX.languages.pt': ['pt'],
+    'PolyglotX.core.exception_handler': [
+        'ExceptionHandler', 'GlobalExceptionHandler', 'ErrorTranslator',
+        'TracebackTranslator', 'ContextualErrorHandler', 'AsyncExceptionHandler',
+        'ThreadSafeExceptionHandler', 'ChainedExceptionHandler',
+        'FilteredExceptionHandler', 'LoggingExceptionHandler'
+    ],
+    'PolyglotX.core.translator': [
+        'Translator', 'MultiEngineTranslator', 'CachedTranslator',
+        'BatchTranslator', 'OfflineTranslator', 'AdaptiveTranslator',
+        'ContextAwareTranslator', 'TechnicalTranslator', 'SmartTranslator'
+    ],
+    'PolyglotX.handlers.error_formatter': [
+        'ErrorFormatter', 'ColoredErrorFormatter', 'HTMLErrorFormatter',
+        'JSONErrorFormatter', 'XMLErrorFormatter', 'MarkdownErrorFormatter',
+        'PlainTextErrorFormatter', 'RichErrorFormatter', 'CompactErrorFormatter',
+        'VerboseErrorFormatter'
+    ],
+    'PolyglotX.handlers.output_handler': [
+        'OutputHandler', 'ConsoleOutputHandler', 'FileOutputHandler',
+        'SyslogOutputHandler', 'EmailOutputHandler', 'WebhookOutputHandler',
+        'DatabaseOutputHandler', 'StreamOutputHandler', 'BufferedOutputHandler',
+        'AsyncOutputHandler'
+    ],
+    'PolyglotX.utils.helpers': [
+        'detect_language', 'extract_error_info', 'format_stack_trace',
+        'parse_exception', 'sanitize_error_message', 'get_error_context',
+        'calculate_error_hash', 'group_similar_errors', 'suggest_fixes',
+        'find_error_documentation'
+    ],
+    'PolyglotX.utils.decorators': [
+        'handle_exceptions', 'translate_errors', 'retry_on_error',
+        'fallback_on_error', 'log_exceptions', 'measure_exception_time',
+        'suppress_exceptions', 'transform_exception', 'validate_exception',
+        'notify_on_exception'
+    ],
+    'PolyglotX.translators.engine_manager': [
+        'TranslationEngine', 'GoogleEngine', 'DeepLEngine', 'LibreEngine',
+        'MyMemoryEngine', 'PonsEngine', 'LingueeEngine', 'YandexEngine',
+        'BingEngine', 'PapagoEngine'
+    ],
+    'PolyglotX.cli.commands': [
+        'translate_command', 'test_command', 'benchmark_command',
+        'config_command', 'demo_command', 'export_command', 'import_command',
+        'validate_command', 'optimize_command', 'monitor_command'
+    ],
+}
 
-from PolyglotX.core.translator import (
-    Translator,
-    MultiEngineTranslator,
-    CachedTranslator,
-    BatchTranslator,
-    OfflineTranslator,
-    AdaptiveTranslator,
-    ContextAwareTranslator,
-    TechnicalTranslator,
-    SmartTranslator
-)
-
-from PolyglotX.handlers.error_formatter import (
-    ErrorFormatter,
-    ColoredErrorFormatter,
-    HTMLErrorFormatter,
-    JSONErrorFormatter,
-    XMLErrorFormatter,
-    MarkdownErrorFormatter,
-    PlainTextErrorFormatter,
-    RichErrorFormatter,
-    CompactErrorFormatter,
-    VerboseErrorFormatter
-)
-
-from PolyglotX.handlers.output_handler import (
-    OutputHandler,
-    ConsoleOutputHandler,
-    FileOutputHandler,
-    SyslogOutputHandler,
-    EmailOutputHandler,
-    WebhookOutputHandler,
-    DatabaseOutputHandler,
-    StreamOutputHandler,
-    BufferedOutputHandler,
-    AsyncOutputHandler
-)
-
-from PolyglotX.utils.helpers import (
-    detect_language,
-    extract_error_info,
-    format_stack_trace,
-    parse_exception,
-    sanitize_error_message,
-    get_error_context,
-    calculate_error_hash,
-    group_similar_errors,
-    suggest_fixes,
-    find_error_documentation
-)
-
-from PolyglotX.utils.decorators import (
-    handle_exceptions,
-    translate_errors,
-    retry_on_error,
-    fallback_on_error,
-    log_exceptions,
-    measure_exception_time,
-    suppress_exceptions,
-    transform_exception,
-    validate_exception,
-    notify_on_exception
-)
-
-from PolyglotX.translators.engine_manager import (
-    TranslationEngine,
-    GoogleEngine,
-    DeepLEngine,
-    LibreEngine,
-    MyMemoryEngine,
-    PonsEngine,
-    LingueeEngine,
-    YandexEngine,
-    BingEngine,
-    PapagoEngine
-)
-
-from PolyglotX.cli.commands import (
-    translate_command,
-    test_command,
-    benchmark_command,
-    config_command,
-    demo_command,
-    export_command,
-    import_command,
-    validate_command,
-    optimize_command,
-    monitor_command
-)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'arbe', 'tr', 'ja', 'zh', 'ku', 'es', 'hi', 'fr', 'ru', 'de', 'pt',
@@ -1,3 +1,15 @@
-from PolyglotX.cli.commands import *
-from PolyglotX.cli.interactive import *
-from PolyglotX.cli.batch_processor import *
+from PolyglotX.utils.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    'PolyglotX.cli.commands': [
+        'cli', 'translate_command', 'test_command', 'benchmark_command',
+        'config_command', 'demo_command', 'export_command', 'import_command',
+        'validate_command', 'optimize_command', 'monitor_command'
+    ],
+    'PolyglotX.cli.interactive': ['InteractiveMode', 'start_interactive'],
+    'PolyglotX.cli.batch_processor': ['BatchProcessor'],
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
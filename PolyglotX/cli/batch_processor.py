@@ -1,35 +1,33 @@
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 from PolyglotX.core.translator import BatchTranslator
 
 
 class BatchProcessor:
-    def __init__(self, language: str = 'ar', batch_size: int = 100):
+    def __init__(self, language: str = 'ar', batch_size: int = 100, workers: int = 1):
         self.language = language
-        self.translator = BatchTranslator(target_language=language, batch_size=batch_size)
+        self.translator = BatchTranslator(target_language=language, batch_size=batch_size, workers=workers)
         
-    def process_file(self, input_file: str, output_file: str):
+    def process_file(self, input_file: str, output_file: str, progress: Optional[Callable[[int, int], None]] = None):
         with open(input_file, 'r', encoding='utf-8') as f:
             lines = f.readlines()
         
-        translated = self.translator.auto_translate_batch(lines)
+        translated = self.translator.auto_translate_batch(lines, progress)
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.writelines(translated)
     
-    def process_json(self, input_file: str, output_file: str):
+    def process_json(self, input_file: str, output_file: str, progress: Optional[Callable[[int, int], None]] = None):
         with open(input_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
         if isinstance(data, list):
-            translated = self.translator.auto_translate_batch(data)
+            translated = self.translator.auto_translate_batch(data, progress)
         elif isinstance(data, dict):
-            translated = {}
-            for key, value in data.items():
-                if isinstance(value, str):
-                    translated[key] = self.translator.translate(value)
-                else:
-                    translated[key] = value
+            keys = [key for key, value in data.items() if isinstance(value, str)]
+            values = self.translator.auto_translate_batch([data[key] for key in keys], progress)
+            translated = dict(data)
+            translated.update(zip(keys, values))
         else:
             translated = data
         
@@ -1,5 +1,35 @@
-from PolyglotX.core.exception_handler import *
-from PolyglotX.core.translator import *
-from PolyglotX.core.error_processor import *
-from PolyglotX.core.language_detector import *
-from PolyglotX.core.context_manager import *
+from PolyglotX.utils.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    'PolyglotX.core.exception_handler': [
+        'ExceptionHandler', 'GlobalExceptionHandler', 'ErrorTranslator',
+        'TracebackTranslator', 'ContextualErrorHandler', 'AsyncExceptionHandler',
+        'ThreadSafeExceptionHandler', 'ChainedExceptionHandler',
+        'FilteredExceptionHandler', 'LoggingExceptionHandler'
+    ],
+    'PolyglotX.core.translator': [
+        'Translator', 'MultiEngineTranslator', 'CachedTranslator',
+        'BatchTranslator', 'OfflineTranslator', 'AdaptiveTranslator',
+        'ContextAwareTranslator', 'TechnicalTranslator', 'SmartTranslator'
+    ],
+    'PolyglotX.core.error_processor': [
+        'ErrorProcessor', 'StackTraceAnalyzer', 'ErrorClassifier', 'ErrorEnricher'
+    ],
+    'PolyglotX.core.message_template': ['MessageTemplate', 'extract_template', 'has_translatable_text'],
+    'PolyglotX.core.message_catalog': ['MessageCatalog', 'get_message_catalog'],
+    'PolyglotX.core.deadline': ['Deadline'],
+    'PolyglotX.core.frame_templates': ['FrameTemplates', 'get_frame_templates'],
+    'PolyglotX.core.report_builder': ['ReportBuilder'],
+    'PolyglotX.core.knowledge_base': ['ErrorKnowledgeBase', 'get_knowledge_base'],
+    'PolyglotX.core.source_cache': ['SourceCache', 'get_source_cache'],
+    'PolyglotX.core.frame_snapshot': ['FrameSnapshotter', 'SnapshotBudget', 'get_frame_snapshotter'],
+    'PolyglotX.core.language_detector': ['LanguageDetector', 'ScriptDetector'],
+    'PolyglotX.core.context_manager': [
+        'ErrorContext', 'translated_errors', 'suppress_translated_errors',
+        'ScopedExceptionHandler', 'MultiLanguageContext'
+    ],
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
@@ -0,0 +1,29 @@
+import time
+from typing import Dict, Any, Optional
+
+
+class Deadline:
+    def __init__(self, budget: float, parent: Optional['Deadline'] = None):
+        self.budget = budget
+        self.started = time.monotonic()
+        self.expires = self.started + budget
+        if parent is not None:
+            self.expires = min(self.expires, parent.expires)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def get_report(self) -> Dict[str, Any]:
+        elapsed = self.elapsed()
+        return {
+            'budget': self.budget,
+            'elapsed': elapsed,
+            'used': elapsed / self.budget if self.budget else 1.0,
+            'expired': self.expired()
+        }
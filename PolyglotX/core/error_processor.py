@@ -3,6 +3,11 @@ import sys
 import traceback
 from typing import Dict, List, Any, Optional, Tuple
 from PolyglotX.core.translator import Translator
+from PolyglotX.core.frame_templates import get_frame_templates
+from PolyglotX.core.report_builder import ReportBuilder
+from PolyglotX.core.knowledge_base import get_knowledge_base
+from PolyglotX.core.source_cache import get_source_cache
+from PolyglotX.core.frame_snapshot import FrameSnapshotter, get_frame_snapshotter
 
 
 class ErrorProcessor:
@@ -11,11 +16,13 @@ class ErrorProcessor:
         self.translator = Translator(target_language=language)
         
     def process_exception(self, exc: Exception) -> Dict[str, Any]:
+        report = ReportBuilder(self.translator)
+        error_type, error_message = report.extend([type(exc).__name__, str(exc)])
         return {
-            'type': type(exc).__name__,
-            'message': str(exc),
-            'translated_type': self.translator.translate(type(exc).__name__),
-            'translated_message': self.translator.translate(str(exc)),
+            'type': error_type,
+            'message': error_message,
+            'translated_type': report[error_type],
+            'translated_message': report[error_message],
             'traceback': self._extract_traceback(exc)
         }
     
@@ -36,21 +43,15 @@ class ErrorProcessor:
         return tb_list
     
     def _get_code_context(self, filename: str, lineno: int, context: int = 3) -> List[str]:
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                start = max(0, lineno - context - 1)
-                end = min(len(lines), lineno + context)
-                return lines[start:end]
-        except:
-            return []
+        return get_source_cache().get_context(filename, lineno, context, context)
     
     def format_error_output(self, error_info: Dict[str, Any]) -> str:
         output = []
         output.append(f"{error_info['translated_type']}: {error_info['translated_message']}\n")
+        frames = get_frame_templates(self.language, self.translator)
         
         for tb_entry in error_info['traceback']:
-            output.append(f"  {self.translator.translate('File')} \"{tb_entry['filename']}\", {self.translator.translate('line')} {tb_entry['lineno']}, {self.translator.translate('in')} {tb_entry['function']}")
+            output.append(frames.format_frame(tb_entry['filename'], tb_entry['lineno'], tb_entry['function']))
             
             if tb_entry['code']:
                 for line in tb_entry['code']:
@@ -60,30 +61,22 @@ class ErrorProcessor:
 
 
 class StackTraceAnalyzer:
-    def __init__(self, language: str = 'ar'):
+    def __init__(self, language: str = 'ar', snapshotter: Optional[FrameSnapshotter] = None):
         self.language = language
         self.translator = Translator(target_language=language)
+        self.snapshotter = snapshotter or get_frame_snapshotter()
         
     def analyze_stack(self, exc_traceback: Any) -> Dict[str, Any]:
-        frames = []
-        tb = exc_traceback
-        
-        while tb is not None:
-            frame_info = {
-                'file': tb.tb_frame.f_code.co_filename,
-                'line': tb.tb_lineno,
-                'function': tb.tb_frame.f_code.co_name,
-                'locals': dict(tb.tb_frame.f_locals),
-                'globals_count': len(tb.tb_frame.f_globals)
-            }
-            frames.append(frame_info)
-            tb = tb.tb_next
+        snapshot = self.snapshotter.snapshot_frames(exc_traceback)
+        frames = snapshot['frames']
         
         return {
             'depth': len(frames),
             'frames': frames,
             'top_frame': frames[0] if frames else None,
-            'bottom_frame': frames[-1] if frames else None
+            'bottom_frame': frames[-1] if frames else None,
+            'captured_frames': snapshot['captured_frames'],
+            'snapshot_budget': snapshot['budget']
         }
     
     def find_error_location(self, exc_traceback: Any) -> Tuple[str, int, str]:
@@ -146,64 +139,48 @@ class ErrorEnricher:
     def __init__(self, language: str = 'ar'):
         self.language = language
         self.translator = Translator(target_language=language)
+        self._knowledge = get_knowledge_base()
         
     def enrich_error(self, exc: Exception) -> Dict[str, Any]:
+        report = ReportBuilder(self.translator)
+        error_type, error_message = report.extend([type(exc).__name__, str(exc)])
+        
+        pending = {}
+        knowledge = {}
+        for kind in ('suggestions', 'causes'):
+            knowledge[kind] = self._knowledge.get(kind, exc, self.language)
+            if knowledge[kind] is None:
+                pending[kind] = report.extend(self._knowledge.entries(kind, exc))
+        
+        for kind, entries in pending.items():
+            knowledge[kind] = report.get_many(entries)
+            self._knowledge.remember(kind, exc, self.language, knowledge[kind])
+        
         enriched = {
-            'original_type': type(exc).__name__,
-            'original_message': str(exc),
-            'translated_type': self.translator.translate(type(exc).__name__),
-            'translated_message': self.translator.translate(str(exc)),
-            'suggestions': self._get_suggestions(exc),
+            'original_type': error_type,
+            'original_message': error_message,
+            'translated_type': report[error_type],
+            'translated_message': report[error_message],
+            'suggestions': knowledge['suggestions'],
             'related_docs': self._get_related_docs(exc),
-            'common_causes': self._get_common_causes(exc)
+            'common_causes': knowledge['causes']
         }
         
         return enriched
     
+    def _get_knowledge(self, kind: str, exc: Exception) -> List[str]:
+        translated = self._knowledge.get(kind, exc, self.language)
+        if translated is None:
+            translated = self.translator.translate_many(self._knowledge.entries(kind, exc))
+            self._knowledge.remember(kind, exc, self.language, translated)
+        return translated
+    
     def _get_suggestions(self, exc: Exception) -> List[str]:
-        exc_type = type(exc).__name__
-        suggestions = {
-            'NameError': [
-                self.translator.translate('Check if the variable is defined'),
-                self.translator.translate('Check for typos in variable name'),
-                self.translator.translate('Ensure the variable is in scope')
-            ],
-            'TypeError': [
-                self.translator.translate('Check argument types'),
-                self.translator.translate('Ensure correct number of arguments'),
-                self.translator.translate('Verify object supports the operation')
-            ],
-            'ValueError': [
-                self.translator.translate('Check input value range'),
-                self.translator.translate('Verify value format'),
-                self.translator.translate('Ensure value is appropriate for operation')
-            ],
-            'FileNotFoundError': [
-                self.translator.translate('Check if file exists'),
-                self.translator.translate('Verify file path is correct'),
-                self.translator.translate('Ensure you have read permissions')
-            ]
-        }
-        
-        return suggestions.get(exc_type, [])
+        return self._get_knowledge('suggestions', exc)
     
     def _get_related_docs(self, exc: Exception) -> List[str]:
         exc_type = type(exc).__name__
         return [f"https://docs.python.org/3/library/exceptions.html#{exc_type}"]
     
     def _get_common_causes(self, exc: Exception) -> List[str]:
-        exc_type = type(exc).__name__
-        causes = {
-            'NameError': [
-                self.translator.translate('Variable not defined'),
-                self.translator.translate('Misspelled variable name'),
-                self.translator.translate('Variable out of scope')
-            ],
-            'ImportError': [
-                self.translator.translate('Module not installed'),
-                self.translator.translate('Wrong module name'),
-                self.translator.translate('Circular import')
-            ]
-        }
-        
-        return causes.get(exc_type, [])
+        return self._get_knowledge('causes', exc)
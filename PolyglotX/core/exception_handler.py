@@ -1,4 +1,5 @@
 import sys
+import asyncio
 import traceback
 import threading
 import inspect
@@ -6,13 +7,19 @@ import os
 from typing import Optional, Callable, Any, Dict, List, Type
 from datetime import datetime
 from PolyglotX.core.translator import Translator, SmartTranslator
+from PolyglotX.core.frame_templates import get_frame_templates
+from PolyglotX.core.report_builder import ReportBuilder
+from PolyglotX.core.frame_snapshot import FrameSnapshotter, get_frame_snapshotter
 
 
 class ExceptionHandler:
-    def __init__(self, language: str = 'ar', show_credits: bool = True, auto_exit: bool = True):
+    def __init__(self, language: str = 'ar', show_credits: bool = True, auto_exit: bool = True,
+                 budget: Optional[float] = 1.0):
         self.language = language
         self.show_credits = show_credits
         self.auto_exit = auto_exit
+        self.budget = budget
+        self.last_budget = None
         self.translator = SmartTranslator(target_language=language)
         self._original_excepthook = sys.excepthook
         self._installed = False
@@ -31,25 +38,32 @@ class ExceptionHandler:
     
     def _exception_hook(self, exc_type, exc_value, exc_traceback):
         self._error_count += 1
-        self._error_history.append({
+        entry = {
             'type': exc_type.__name__,
             'message': str(exc_value),
             'time': datetime.now().isoformat()
-        })
+        }
+        self._error_history.append(entry)
         
         error_type = exc_type.__name__
         error_message = str(exc_value)
         
-        translated_type = self.translator.translate(error_type)
-        translated_message = self.translator.translate(error_message)
-        
-        print(f"\n{translated_type}: {translated_message}\n")
+        with self.translator.deadline(self.budget) as deadline:
+            report = ReportBuilder(self.translator)
+            report.extend([error_type, error_message])
+            translated_type, translated_message = report.get_many([error_type, error_message])
+            
+            print(f"\n{translated_type}: {translated_message}\n")
+            
+            if exc_traceback:
+                tb_lines = traceback.format_tb(exc_traceback)
+                for line in tb_lines:
+                    translated_line = self._translate_traceback_line(line)
+                    print(translated_line, end='')
         
-        if exc_traceback:
-            tb_lines = traceback.format_tb(exc_traceback)
-            for line in tb_lines:
-                translated_line = self._translate_traceback_line(line)
-                print(translated_line, end='')
+        if deadline is not None:
+            self.last_budget = deadline.get_report()
+            entry['budget'] = self.last_budget
         
         if self.show_credits:
             credits_message = self._get_credits_message()
@@ -59,17 +73,7 @@ class ExceptionHandler:
             sys.exit(1)
     
     def _translate_traceback_line(self, line: str) -> str:
-        parts = line.split(',')
-        translated_parts = []
-        
-        for part in parts:
-            if 'File' in part or 'line' in part:
-                translated_part = self.translator.translate_parts(part)
-                translated_parts.append(translated_part)
-            else:
-                translated_parts.append(part)
-        
-        return ','.join(translated_parts)
+        return get_frame_templates(self.language, self.translator).translate_entry(line)
     
     def _get_credits_message(self) -> str:
         messages = {
@@ -90,7 +94,8 @@ class ExceptionHandler:
     def get_error_stats(self) -> Dict[str, Any]:
         return {
             'total_errors': self._error_count,
-            'history': self._error_history
+            'history': self._error_history,
+            'last_budget': self.last_budget
         }
 
 
@@ -105,9 +110,10 @@ class GlobalExceptionHandler(ExceptionHandler):
                     cls._instance = super().__new__(cls)
         return cls._instance
     
-    def __init__(self, language: str = 'ar', show_credits: bool = True, auto_exit: bool = True):
+    def __init__(self, language: str = 'ar', show_credits: bool = True, auto_exit: bool = True,
+                 budget: Optional[float] = 1.0):
         if not hasattr(self, '_initialized'):
-            super().__init__(language, show_credits, auto_exit)
+            super().__init__(language, show_credits, auto_exit, budget)
             self._initialized = True
 
 
@@ -126,14 +132,8 @@ class ErrorTranslator:
         return f"{translated_type}: {translated_message}"
     
     def translate_traceback(self, tb: Any) -> List[str]:
-        tb_lines = traceback.format_tb(tb)
-        translated_lines = []
-        
-        for line in tb_lines:
-            translated_line = self.translator.translate_parts(line)
-            translated_lines.append(translated_line)
-        
-        return translated_lines
+        frames = get_frame_templates(self.language, self.translator)
+        return [frames.translate_entry(line) for line in traceback.format_tb(tb)]
 
 
 class TracebackTranslator:
@@ -144,13 +144,12 @@ class TracebackTranslator:
     def format_traceback(self, exc_info: tuple) -> str:
         exc_type, exc_value, exc_traceback = exc_info
         
-        lines = []
-        lines.append(self.translator.translate("Traceback (most recent call last):"))
+        frames = get_frame_templates(self.language, self.translator)
+        lines = [frames.header]
         
         tb_lines = traceback.format_tb(exc_traceback)
         for line in tb_lines:
-            translated_line = self.translator.translate_parts(line)
-            lines.append(translated_line)
+            lines.append(frames.translate_entry(line))
         
         error_line = f"{exc_type.__name__}: {exc_value}"
         translated_error = self.translator.translate(error_line)
@@ -160,32 +159,49 @@ class TracebackTranslator:
 
 
 class ContextualErrorHandler(ExceptionHandler):
-    def __init__(self, language: str = 'ar', include_locals: bool = True, include_globals: bool = False):
+    def __init__(self, language: str = 'ar', include_locals: bool = True, include_globals: bool = False,
+                 snapshotter: Optional[FrameSnapshotter] = None):
         super().__init__(language)
         self.include_locals = include_locals
         self.include_globals = include_globals
+        self.snapshotter = snapshotter or get_frame_snapshotter()
         
     def _exception_hook(self, exc_type, exc_value, exc_traceback):
         super()._exception_hook(exc_type, exc_value, exc_traceback)
         
         if self.include_locals or self.include_globals:
             frame = exc_traceback.tb_frame
+            budget = self.snapshotter.start()
+            sections = []
             
             if self.include_locals:
-                print(f"\n{self.translator.translate('Local variables')}:")
-                for key, value in frame.f_locals.items():
-                    print(f"  {key} = {repr(value)}")
+                variables, omitted = self.snapshotter.snapshot_variables(frame.f_locals, budget)
+                sections.append(('Local variables', variables, omitted))
             
             if self.include_globals:
-                print(f"\n{self.translator.translate('Global variables')}:")
-                for key, value in frame.f_globals.items():
-                    if not key.startswith('__'):
-                        print(f"  {key} = {repr(value)}")
+                variables, omitted = self.snapshotter.snapshot_variables(frame.f_globals, budget, skip_private=True)
+                sections.append(('Global variables', variables, omitted))
+            
+            with self.translator.deadline(self.budget):
+                report = ReportBuilder(self.translator)
+                report.extend(title for title, _, _ in sections)
+                if any(omitted for _, _, omitted in sections):
+                    report.add('more')
+                for title, variables, omitted in sections:
+                    self._print_variables(report[title], variables, omitted, report['more'] if omitted else '')
+    
+    def _print_variables(self, title: str, variables: Dict[str, str], omitted: int, more: str):
+        print(f"\n{title}:")
+        for key, value in variables.items():
+            print(f"  {key} = {value}")
+        if omitted:
+            print(f"  ... ({omitted}+ {more})")
 
 
 class AsyncExceptionHandler(ExceptionHandler):
-    def __init__(self, language: str = 'ar'):
+    def __init__(self, language: str = 'ar', timeout: Optional[float] = 5.0):
         super().__init__(language)
+        self.timeout = timeout
         self._async_errors = []
         
     async def handle_async_exception(self, coro):
@@ -193,12 +209,24 @@ class AsyncExceptionHandler(ExceptionHandler):
             return await coro
         except Exception as e:
             self._async_errors.append(e)
-            error_msg = self.translator.translate_error(e)
+            error_msg = await self.translate_error(e)
             print(f"\n{error_msg}")
             if self.show_credits:
                 print(f"\n{self._get_credits_message()}")
             raise
     
+    async def translate_error(self, error: Exception) -> str:
+        error_type = type(error).__name__
+        error_message = str(error)
+        
+        try:
+            error_type, error_message = await self.translator.atranslate_many([error_type, error_message],
+                                                                              timeout=self.timeout)
+        except asyncio.TimeoutError:
+            pass
+        
+        return f"{error_type}: {error_message}"
+    
     def get_async_errors(self) -> List[Exception]:
         return self._async_errors
 
@@ -0,0 +1,132 @@
+import reprlib
+from collections import deque
+from itertools import islice
+from typing import Dict, Any, Optional, Tuple
+from PolyglotX.core.deadline import Deadline
+
+
+_SIZED_TYPES = (list, tuple, dict, set, frozenset, deque)
+_TEXT_TYPES = (str, bytes, bytearray)
+
+
+class SnapshotBudget:
+    def __init__(self, max_chars: int, budget: Optional[float] = None):
+        self.max_chars = max_chars
+        self.used = 0
+        self.deadline = Deadline(budget) if budget is not None else None
+
+    def exhausted(self) -> bool:
+        return self.used >= self.max_chars or (self.deadline is not None and self.deadline.expired())
+
+    def get_report(self) -> Dict[str, Any]:
+        report = self.deadline.get_report() if self.deadline is not None else {}
+        report['chars'] = self.used
+        report['max_chars'] = self.max_chars
+        return report
+
+
+class FrameSnapshotter:
+    def __init__(self, max_frames: int = 32, max_variables: int = 50, max_value_chars: int = 200,
+                 max_items: int = 100, max_report_chars: int = 64 * 1024, budget: Optional[float] = 0.5):
+        self.max_frames = max_frames
+        self.max_variables = max_variables
+        self.max_value_chars = max_value_chars
+        self.max_items = max_items
+        self.max_report_chars = max_report_chars
+        self.budget = budget
+        self._repr = reprlib.Repr()
+        self._repr.maxlevel = 2
+        self._repr.maxstring = max_value_chars
+        self._repr.maxother = max_value_chars
+        for name in ('maxtuple', 'maxlist', 'maxarray', 'maxdict', 'maxset', 'maxfrozenset', 'maxdeque'):
+            setattr(self._repr, name, min(getattr(self._repr, name), max_items))
+
+    def safe_repr(self, value: Any) -> str:
+        try:
+            if isinstance(value, _TEXT_TYPES) and len(value) > self.max_value_chars:
+                text = repr(value[:self.max_value_chars])
+                return f"{text}... <{type(value).__name__} of {len(value)} items>"
+            if isinstance(value, _SIZED_TYPES) and len(value) > self.max_items:
+                return f"<{type(value).__name__} of {len(value)} items>"
+            nbytes = getattr(value, 'nbytes', None) if not isinstance(value, type) else None
+            if isinstance(nbytes, int) and nbytes > self.max_report_chars:
+                shape = getattr(value, 'shape', None)
+                detail = f" shape={shape}" if shape is not None else ''
+                return f"<{type(value).__name__}{detail} of {nbytes} bytes>"
+            text = self._repr.repr(value)
+        except Exception as e:
+            return f"<{type(value).__name__} object (repr failed: {type(e).__name__})>"
+        if len(text) > self.max_value_chars:
+            text = text[:self.max_value_chars - 3] + '...'
+        return text
+
+    def start(self) -> SnapshotBudget:
+        return SnapshotBudget(self.max_report_chars, self.budget)
+
+    def snapshot_variables(self, variables: Dict[str, Any], budget: Optional[SnapshotBudget] = None,
+                           skip_private: bool = False) -> Tuple[Dict[str, str], int]:
+        if budget is None:
+            budget = self.start()
+
+        snapshot = {}
+        omitted = 0
+        try:
+            items = list(islice(((key, value) for key, value in variables.items()
+                                 if not (skip_private and str(key).startswith('__'))),
+                                self.max_variables + 1))
+        except Exception:
+            return snapshot, 0
+
+        for index, (key, value) in enumerate(items):
+            if index >= self.max_variables or budget.exhausted():
+                omitted = len(items) - index
+                break
+            text = self.safe_repr(value)
+            snapshot[str(key)] = text
+            budget.used += len(text)
+
+        if len(items) > self.max_variables:
+            omitted = max(omitted, 1)
+        return snapshot, omitted
+
+    def snapshot_frames(self, exc_traceback: Any, include_globals: bool = False) -> Dict[str, Any]:
+        entries = []
+        tb = exc_traceback
+        while tb is not None:
+            entries.append(tb)
+            tb = tb.tb_next
+
+        budget = self.start()
+        first_captured = max(0, len(entries) - self.max_frames)
+        frames = []
+        for index, tb in enumerate(entries):
+            frame = tb.tb_frame
+            frame_info = {
+                'file': frame.f_code.co_filename,
+                'line': tb.tb_lineno,
+                'function': frame.f_code.co_name,
+                'locals': {},
+                'omitted_locals': 0,
+                'globals_count': len(frame.f_globals)
+            }
+            if index >= first_captured:
+                frame_info['locals'], frame_info['omitted_locals'] = self.snapshot_variables(frame.f_locals, budget)
+                if include_globals:
+                    frame_info['globals'], _ = self.snapshot_variables(frame.f_globals, budget, skip_private=True)
+            frames.append(frame_info)
+
+        return {
+            'frames': frames,
+            'captured_frames': len(entries) - first_captured,
+            'budget': budget.get_report()
+        }
+
+
+_snapshotter = None
+
+
+def get_frame_snapshotter() -> FrameSnapshotter:
+    global _snapshotter
+    if _snapshotter is None:
+        _snapshotter = FrameSnapshotter()
+    return _snapshotter
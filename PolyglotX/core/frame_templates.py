@@ -0,0 +1,65 @@
+import re
+import threading
+from typing import Dict, Any, Optional, Tuple
+from PolyglotX.core.message_catalog import get_message_catalog
+
+
+_FRAME_PATTERN = re.compile(r'^(\s*)File "(.*)", line (\d+), in (.*)$')
+_WORDS = ('File', 'line', 'in', 'Traceback (most recent call last):')
+
+
+class FrameTemplates:
+    def __init__(self, language: str, words: Dict[str, str]):
+        self.language = language
+        self.words = words
+        self.header = words['Traceback (most recent call last):']
+        self.frame = '{indent}' + _escape(words['File']) + ' "{path}", ' + _escape(words['line']) + \
+                     ' {lineno}, ' + _escape(words['in']) + ' {func}'
+
+    def format_frame(self, path: str, lineno: Any, func: str, indent: str = '  ') -> str:
+        return self.frame.format(indent=indent, path=path, lineno=lineno, func=func)
+
+    def translate_entry(self, entry: str) -> str:
+        first, newline, rest = entry.partition('\n')
+        match = _FRAME_PATTERN.match(first)
+        if match is None:
+            return entry
+        indent, path, lineno, func = match.groups()
+        return self.format_frame(path, lineno, func, indent) + newline + rest
+
+
+def _escape(word: str) -> str:
+    return word.replace('{', '{{').replace('}', '}}')
+
+
+def _resolve_words(language: str, translator: Optional[Any]) -> Tuple[Dict[str, str], bool]:
+    if language == 'en':
+        return {word: word for word in _WORDS}, True
+
+    catalog = get_message_catalog()
+    words = {}
+    complete = True
+    for word in _WORDS:
+        translated = catalog.lookup(word, language)
+        if translated is None:
+            translated = translator.translate(word) if translator is not None else word
+            complete = complete and translated != word
+        words[word] = translated or word
+    return words, complete
+
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def get_frame_templates(language: str, translator: Optional[Any] = None) -> FrameTemplates:
+    templates = _templates.get(language)
+    if templates is not None:
+        return templates
+
+    words, complete = _resolve_words(language, translator)
+    if not complete:
+        return FrameTemplates(language, words)
+
+    with _templates_lock:
+        return _templates.setdefault(language, FrameTemplates(language, words))
@@ -0,0 +1,150 @@
+import threading
+from typing import Dict, List, Any, Optional
+
+
+_KNOWLEDGE = {
+    'suggestions': {
+        'NameError': [
+            'Check if the variable is defined before use',
+            'Verify the spelling of the variable name',
+            'Ensure the variable is in the correct scope'
+        ],
+        'AttributeError': [
+            'Check that the object has the attribute you are accessing',
+            'Verify the spelling of the attribute name',
+            'Ensure the object is not None'
+        ],
+        'TypeError': [
+            'Check the types of arguments passed to the function',
+            'Verify the number of arguments matches the function signature',
+            'Ensure the object supports the operation'
+        ],
+        'ValueError': [
+            'Check if the value is in the expected range',
+            'Verify the format of the input value',
+            'Ensure the value is appropriate for the operation'
+        ],
+        'KeyError': [
+            'Check that the key exists before accessing it',
+            'Use dict.get() to provide a default value'
+        ],
+        'IndexError': [
+            'Check the length of the sequence before indexing',
+            'Verify loop bounds and offsets'
+        ],
+        'ZeroDivisionError': [
+            'Check that the divisor is not zero before dividing'
+        ],
+        'ImportError': [
+            'Check if the module is installed',
+            'Verify the module name is correct',
+            'Ensure the module is in PYTHONPATH'
+        ],
+        'FileNotFoundError': [
+            'Verify the file path is correct',
+            'Check if the file exists',
+            'Ensure you have read permissions'
+        ],
+        'PermissionError': [
+            'Check the file or directory permissions',
+            'Run the program with a user that has access'
+        ],
+        'RecursionError': [
+            'Check that the recursion has a reachable base case',
+            'Consider rewriting the recursion as a loop'
+        ]
+    },
+    'causes': {
+        'NameError': [
+            'Variable not defined',
+            'Misspelled variable name',
+            'Variable out of scope'
+        ],
+        'AttributeError': [
+            'Misspelled attribute name',
+            'Object is None',
+            'Wrong object type'
+        ],
+        'KeyError': [
+            'Missing dictionary key',
+            'Misspelled key'
+        ],
+        'IndexError': [
+            'Index out of range',
+            'Empty sequence'
+        ],
+        'ImportError': [
+            'Module not installed',
+            'Wrong module name',
+            'Circular import'
+        ],
+        'FileNotFoundError': [
+            'Wrong file path',
+            'File was moved or deleted'
+        ]
+    }
+}
+
+
+class ErrorKnowledgeBase:
+    def __init__(self, knowledge: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        self._knowledge = knowledge or _KNOWLEDGE
+        self._resolved = {}
+        self._translated = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, kind: str, exc: Any) -> Optional[str]:
+        exc_class = exc if isinstance(exc, type) else type(exc)
+        cache_key = (kind, exc_class)
+        if cache_key in self._resolved:
+            return self._resolved[cache_key]
+
+        table = self._knowledge.get(kind, {})
+        name = None
+        for cls in exc_class.__mro__:
+            if cls.__name__ in table:
+                name = cls.__name__
+                break
+        self._resolved[cache_key] = name
+        return name
+
+    def entries(self, kind: str, exc: Any) -> List[str]:
+        name = self._resolve(kind, exc)
+        return list(self._knowledge[kind][name]) if name else []
+
+    def get(self, kind: str, exc: Any, language: str = 'en') -> Optional[List[str]]:
+        name = self._resolve(kind, exc)
+        if name is None:
+            return []
+        if language == 'en':
+            return list(self._knowledge[kind][name])
+        translated = self._translated.get((kind, name, language))
+        return None if translated is None else list(translated)
+
+    def remember(self, kind: str, exc: Any, language: str, translated: List[str]):
+        name = self._resolve(kind, exc)
+        if name is None or len(translated) != len(self._knowledge[kind][name]):
+            return
+        if any(result == text for result, text in zip(translated, self._knowledge[kind][name])):
+            return
+        with self._lock:
+            self._translated[(kind, name, language)] = tuple(translated)
+
+    def suggestions(self, exc: Any, language: str = 'en') -> Optional[List[str]]:
+        return self.get('suggestions', exc, language)
+
+    def causes(self, exc: Any, language: str = 'en') -> Optional[List[str]]:
+        return self.get('causes', exc, language)
+
+
+_knowledge_base = None
+_knowledge_base_lock = threading.Lock()
+
+
+def get_knowledge_base() -> ErrorKnowledgeBase:
+    global _knowledge_base
+    if _knowledge_base is None:
+        with _knowledge_base_lock:
+            if _knowledge_base is None:
+                _knowledge_base = ErrorKnowledgeBase()
+    return _knowledge_base
@@ -1,11 +1,11 @@
 import re
 from typing import Optional, Dict, List
-from translatepy import Translate
+from PolyglotX.translators.engine_registry import get_engine_registry
 
 
 class LanguageDetector:
     def __init__(self):
-        self._translator = Translate()
+        self._registry = get_engine_registry()
         self._language_patterns = self._init_patterns()
         
     def _init_patterns(self) -> Dict[str, List[str]]:
@@ -30,7 +30,7 @@ class LanguageDetector:
                     return lang
         
         try:
-            result = self._translator.language(text)
+            result = self._registry.get_translatepy().language(text)
             return result.alpha2 if hasattr(result, 'alpha2') else None
         except:
             return None
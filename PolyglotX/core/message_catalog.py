@@ -0,0 +1,85 @@
+import os
+import json
+import threading
+from typing import Dict, List, Optional
+
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'exception_messages.json')
+
+
+class MessageCatalog:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_CATALOG_PATH
+        self.version = None
+        self.python_version = None
+        self.languages = []
+        self._positions = {}
+        self._messages = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.version = data.get('version')
+                self.python_version = data.get('python')
+                self.languages = data.get('languages', [])
+                self._positions = {language: index for index, language in enumerate(self.languages)}
+                self._messages = data.get('messages', {})
+            except (OSError, ValueError):
+                self._messages = {}
+            self._loaded = True
+
+    def lookup(self, text: str, language: str) -> Optional[str]:
+        if not self._loaded:
+            self._load()
+        position = self._positions.get(language)
+        if position is None:
+            return None
+        entry = self._messages.get(text)
+        if entry is None:
+            return None
+        return entry[position] or None
+
+    def supports(self, language: str) -> bool:
+        if not self._loaded:
+            self._load()
+        return language in self._positions
+
+    def messages(self) -> List[str]:
+        if not self._loaded:
+            self._load()
+        return list(self._messages)
+
+    def get_info(self) -> Dict[str, object]:
+        if not self._loaded:
+            self._load()
+        return {
+            'path': self.path,
+            'version': self.version,
+            'python': self.python_version,
+            'languages': list(self.languages),
+            'messages': len(self._messages)
+        }
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self._load()
+        return len(self._messages)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_message_catalog() -> MessageCatalog:
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = MessageCatalog()
+    return _catalog
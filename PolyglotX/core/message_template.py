@@ -0,0 +1,54 @@
+import re
+from typing import List, Optional
+
+
+_VALUE_PATTERN = re.compile(
+    r"""(?<!\w)'[^'\n]*'(?!\w)"""
+    r'''|(?<!\w)"[^"\n]*"(?!\w)'''
+    r'|`[^`\n]*`'
+    r'|(?<![\w.])(?:[A-Za-z]:|~|\.{1,2})?[\\/][\w.\-\\/]+'
+    r'|[\w.-]+(?:[\\/][\w.-]+)+\.\w+'
+    r'|\b0[xX][0-9a-fA-F]+\b'
+    r'|\b\d+(?:\.\d+)?\b'
+    r'|\b[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+(?:\(\))?'
+    r'|\b[A-Za-z_]\w*\(\)'
+    r'|\b[A-Za-z]*_\w*'
+    r'|\b[a-z]+[A-Z]\w*'
+)
+_PLACEHOLDER_PATTERN = re.compile(r'\{\s*(\d+)\s*\}')
+_LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+
+class MessageTemplate:
+    def __init__(self, template: str, values: List[str]):
+        self.template = template
+        self.values = values
+
+    def render(self, translated: str) -> Optional[str]:
+        found = [int(index) for index in _PLACEHOLDER_PATTERN.findall(translated)]
+        if sorted(found) != list(range(len(self.values))):
+            return None
+        return _PLACEHOLDER_PATTERN.sub(lambda match: self.values[int(match.group(1))], translated)
+
+    def __repr__(self) -> str:
+        return f"MessageTemplate({self.template!r}, {self.values!r})"
+
+
+def has_translatable_text(text: str) -> bool:
+    return bool(_LETTER_PATTERN.search(_VALUE_PATTERN.sub('', text)))
+
+
+def extract_template(text: str) -> Optional[MessageTemplate]:
+    if _PLACEHOLDER_PATTERN.search(text):
+        return None
+
+    values = []
+
+    def replace(match):
+        values.append(match.group(0))
+        return '{' + str(len(values) - 1) + '}'
+
+    template = _VALUE_PATTERN.sub(replace, text)
+    if not values or not _LETTER_PATTERN.search(_PLACEHOLDER_PATTERN.sub('', template)):
+        return None
+    return MessageTemplate(template, values)
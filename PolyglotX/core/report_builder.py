@@ -0,0 +1,36 @@
+from typing import Dict, List, Any, Iterable
+
+
+class ReportBuilder:
+    def __init__(self, translator: Any):
+        self.translator = translator
+        self._texts = {}
+        self._translations = None
+
+    def add(self, text: str) -> str:
+        if isinstance(text, str) and text not in self._texts:
+            self._texts[text] = None
+            self._translations = None
+        return text
+
+    def extend(self, texts: Iterable[str]) -> List[str]:
+        return [self.add(text) for text in texts]
+
+    def translate(self, retry: int = 3) -> Dict[str, str]:
+        if self._translations is None:
+            texts = list(self._texts)
+            self._translations = dict(zip(texts, self.translator.translate_many(texts, retry)))
+        return self._translations
+
+    def get(self, text: str) -> str:
+        return self.translate().get(text, text)
+
+    def get_many(self, texts: Iterable[str]) -> List[str]:
+        translations = self.translate()
+        return [translations.get(text, text) for text in texts]
+
+    def __getitem__(self, text: str) -> str:
+        return self.get(text)
+
+    def __len__(self) -> int:
+        return len(self._texts)
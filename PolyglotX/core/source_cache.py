@@ -0,0 +1,142 @@
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional
+
+
+class _SourceFile:
+    def __init__(self, path: str, stat: os.stat_result):
+        with open(path, 'rb') as f:
+            self.data = f.read()
+        self.mtime = stat.st_mtime_ns
+        self.size = len(self.data)
+        self.offsets = self._index(self.data, self.size)
+
+    @staticmethod
+    def _index(data: bytes, size: int) -> array:
+        offsets = array('Q', [0])
+        position = data.find(b'\n')
+        while position != -1:
+            offsets.append(position + 1)
+            position = data.find(b'\n', position + 1)
+        if offsets[-1] != size:
+            offsets.append(size)
+        return offsets
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def cost(self) -> int:
+        return self.size + self.offsets.itemsize * len(self.offsets)
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.mtime == stat.st_mtime_ns and self.size == stat.st_size
+
+    def slice(self, start: int, end: int) -> List[str]:
+        start = max(0, start)
+        end = min(self.line_count, end)
+        return [self.data[self.offsets[i]:self.offsets[i + 1]].decode('utf-8', 'replace').replace('\r\n', '\n')
+                for i in range(start, end)]
+
+
+class SourceCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_file_bytes: Optional[int] = None,
+                 max_files: int = 1024):
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.max_file_bytes = max_file_bytes if max_file_bytes is not None else max_bytes
+        self._files = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get_lines(self, filename: str, start: int, end: int) -> List[str]:
+        try:
+            stat = os.stat(filename)
+        except (OSError, ValueError):
+            return []
+
+        with self._lock:
+            source = self._files.get(filename)
+            if source is not None and source.matches(stat):
+                self._files.move_to_end(filename)
+                self.hits += 1
+                return source.slice(start, end)
+
+            if source is not None:
+                self._discard(filename)
+                self.invalidations += 1
+            self.misses += 1
+
+            try:
+                source = _SourceFile(filename, stat)
+            except (OSError, ValueError):
+                return []
+
+            lines = source.slice(start, end)
+            if source.cost > self.max_file_bytes:
+                return lines
+
+            self._files[filename] = source
+            self._bytes += source.cost
+            self._evict()
+            return lines
+
+    def get_line(self, filename: str, lineno: int) -> str:
+        lines = self.get_lines(filename, lineno - 1, lineno) if lineno > 0 else []
+        return lines[0] if lines else ''
+
+    def get_context(self, filename: str, lineno: int, before: int = 3, after: int = 3) -> List[str]:
+        return self.get_lines(filename, lineno - before - 1, lineno + after)
+
+    def _discard(self, filename: str):
+        source = self._files.pop(filename)
+        self._bytes -= source.cost
+
+    def _evict(self):
+        while self._files and (self._bytes > self.max_bytes or len(self._files) > self.max_files):
+            self._discard(next(iter(self._files)))
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            for filename in list(self._files):
+                self._discard(filename)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'files': len(self._files),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'max_files': self.max_files,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups > 0 else 0
+            }
+
+
+_source_cache = None
+_source_cache_lock = threading.Lock()
+
+
+def get_source_cache() -> SourceCache:
+    global _source_cache
+    if _source_cache is None:
+        with _source_cache_lock:
+            if _source_cache is None:
+                _source_cache = SourceCache()
+    return _source_cache
@@ -1,99 +1,394 @@
 import sys
+import asyncio
 import threading
 import time
 from typing import Dict, List, Optional, Any, Callable, Tuple
-from functools import lru_cache
-from deep_translator import GoogleTranslator, MyMemoryTranslator, LibreTranslator, PonsTranslator, LingueeTranslator
-from translatepy import Translate
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, FIRST_COMPLETED, as_completed, wait
+from PolyglotX.translators.engine_registry import get_engine_registry
+from PolyglotX.translators.memory_cache import StripedLRUCache
+from PolyglotX.core.message_template import extract_template, has_translatable_text
+from PolyglotX.core.message_catalog import get_message_catalog
+from PolyglotX.core.deadline import Deadline
 import re
 
 
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+
+def _split_whitespace(text: str) -> Tuple[str, str, str]:
+    stripped = text.strip()
+    start = text.index(stripped)
+    return text[:start], stripped, text[start + len(stripped):]
+
+
+def _normalize_translation(text: str) -> str:
+    return ' '.join(_PUNCTUATION_PATTERN.sub('', text.casefold()).split())
+
+
 class Translator:
-    def __init__(self, target_language: str = 'ar', source_language: str = 'auto'):
+    def __init__(self, target_language: str = 'ar', source_language: str = 'auto', cache: Optional[Any] = None):
         self.target_language = target_language
         self.source_language = source_language
-        self._cache = {}
-        self._lock = threading.Lock()
+        self._registry = get_engine_registry()
+        self._own_cache = cache
+        self._lock = self._registry.cache_lock
+        self._inflight = self._registry.inflight
+        self._negative = self._registry.negative_cache
+        self._async_inflight = {}
+        self._scope = threading.local()
+        self._hedging = False
+        self._hedge_delay = None
+        self._hedge_stats = {'requests': 0, 'triggered': 0, 'won': 0}
+        self._catalog = get_message_catalog()
         self._engines = self._initialize_engines()
-        self._translatepy = Translate()
         
+    @property
+    def _cache(self) -> Any:
+        return self._registry.cache if self._own_cache is None else self._own_cache
+    
+    @_cache.setter
+    def _cache(self, cache: Any):
+        self._own_cache = cache
+    
     def _initialize_engines(self) -> List[Any]:
-        engines = []
-        try:
-            engines.append(('google', GoogleTranslator))
-        except:
-            pass
-        try:
-            engines.append(('mymemory', MyMemoryTranslator))
-        except:
-            pass
-        try:
-            engines.append(('libre', LibreTranslator))
-        except:
-            pass
-        try:
-            engines.append(('pons', PonsTranslator))
-        except:
-            pass
+        return self._registry.get_clients(self.source_language, self.target_language)
+    
+    def _ranked_engines(self) -> List[Any]:
+        return self._registry.rank_clients(self._engines)
+    
+    def enable_hedging(self, delay: Optional[float] = None):
+        self._hedging = True
+        self._hedge_delay = delay
+    
+    def disable_hedging(self):
+        self._hedging = False
+    
+    def get_hedge_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._hedge_stats)
+    
+    @contextmanager
+    def deadline(self, budget: Optional[float]):
+        parent = self._current_deadline()
+        if budget is None:
+            yield parent
+            return
+        
+        deadline = Deadline(budget, parent)
+        self._scope.deadline = deadline
         try:
-            engines.append(('linguee', LingueeTranslator))
-        except:
-            pass
-        return engines
+            yield deadline
+        finally:
+            self._scope.deadline = parent
+    
+    def _current_deadline(self) -> Optional[Deadline]:
+        return getattr(self._scope, 'deadline', None)
     
     def translate(self, text: str, retry: int = 3) -> str:
-        if not text or not text.strip():
+        if not text or not has_translatable_text(text):
+            return text
+        
+        template = extract_template(text)
+        if template is not None:
+            result = template.render(self._translate_text(template.template, retry))
+            if result is not None:
+                return result
+        
+        return self._translate_text(text, retry)
+    
+    async def atranslate(self, text: str, retry: int = 3, timeout: Optional[float] = None) -> str:
+        loop = asyncio.get_running_loop()
+        key = (loop, self._cache_key(text))
+        future = self._async_inflight.get(key)
+        if future is None:
+            future = loop.run_in_executor(self._registry.get_executor(), self.translate, text, retry)
+            self._async_inflight[key] = future
+            future.add_done_callback(lambda done: self._async_inflight.pop(key, None))
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+    
+    async def atranslate_many(self, texts: List[str], retry: int = 3, max_segments: int = 100, workers: int = 1,
+                              timeout: Optional[float] = None) -> List[str]:
+        return await self._run_async(timeout, self.translate_many, texts, retry, max_segments, workers)
+    
+    async def _run_async(self, timeout: Optional[float], function: Callable, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._registry.get_executor(), function, *args)
+        return await asyncio.wait_for(future, timeout)
+    
+    def _lookup_catalog(self, text: str) -> Optional[str]:
+        if self.source_language not in ('auto', 'en'):
+            return None
+        
+        stripped = text.strip()
+        result = self._catalog.lookup(stripped, self.target_language)
+        if result is None:
+            return None
+        
+        start = text.index(stripped)
+        return text[:start] + result + text[start + len(stripped):]
+    
+    def _cache_key(self, text: str) -> str:
+        return f"{self.source_language}:{self.target_language}:{text}"
+    
+    def _translate_text(self, text: str, retry: int = 3) -> str:
+        result = self._lookup_catalog(text)
+        if result is not None:
+            return result
+        
+        cache_key = self._cache_key(text)
+        
+        result = self._cache.get(cache_key)
+        if result is not None:
+            return result
+        if self._negative.hit(cache_key):
             return text
-            
-        cache_key = f"{self.source_language}:{self.target_language}:{text}"
         
         with self._lock:
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[cache_key] = future
+        
+        if not leader:
+            deadline = self._current_deadline()
+            try:
+                return future.result(None if deadline is None else deadline.remaining())
+            except FutureTimeoutError:
+                return text
+        
+        try:
+            result = self._request_translation(text, cache_key, retry)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+    
+    def _request_translation(self, text: str, cache_key: str, retry: int = 3) -> str:
+        deadline = self._current_deadline()
         
         for attempt in range(retry):
-            for engine_name, engine_class in self._engines:
+            ranked = self._ranked_engines()
+            if self._hedging and len(ranked) > 1:
+                result, used = self._hedged_request(text, ranked[0][1], ranked[1][1], deadline)
+                if result is not None:
+                    return self._store(cache_key, text, result)
+                ranked = ranked[used:]
+            
+            for engine_name, client in ranked:
+                if deadline is not None and deadline.expired():
+                    return text
                 try:
-                    translator = engine_class(source=self.source_language, target=self.target_language)
-                    result = translator.translate(text)
-                    
-                    with self._lock:
-                        self._cache[cache_key] = result
-                    
-                    return result
+                    result = client.translate(text, None if deadline is None else deadline.remaining())
+                    return self._store(cache_key, text, result)
                 except Exception:
                     continue
             
-            try:
-                result = self._translatepy.translate(text, self.target_language).result
-                with self._lock:
-                    self._cache[cache_key] = result
-                return result
-            except:
-                pass
+            if deadline is None:
+                try:
+                    result = self._registry.get_translatepy().translate(text, self.target_language).result
+                    return self._store(cache_key, text, result)
+                except:
+                    pass
             
-            if attempt < retry - 1:
-                time.sleep(0.5 * (attempt + 1))
+            if attempt < retry - 1 and not self._backoff(attempt, deadline):
+                break
         
+        self._negative.add(cache_key)
         return text
     
-    def translate_parts(self, text: str) -> str:
-        parts = re.split(r'(["\'].*?["\']|`.*?`|\d+|[a-zA-Z_][a-zA-Z0-9_]*)', text)
-        translated_parts = []
+    def _store(self, cache_key: str, text: str, result: Optional[str]) -> str:
+        if not result or result.strip() == text.strip():
+            self._negative.add(cache_key)
+            return result or text
+        
+        self._negative.discard(cache_key)
+        with self._lock:
+            self._cache[cache_key] = result
+        return result
+    
+    def _hedged_request(self, text: str, primary: Any, secondary: Any,
+                        deadline: Optional[Deadline]) -> Tuple[Optional[str], int]:
+        executor = self._registry.get_executor('hedge')
+        remaining = None if deadline is None else deadline.remaining()
+        futures = {executor.submit(primary.translate, text, remaining): False}
+        
+        delay = self._hedge_delay
+        if delay is None:
+            delay = primary.health.percentile(95) or 0.3
+        if remaining is not None:
+            delay = min(delay, remaining)
         
-        for part in parts:
-            if not part:
+        with self._lock:
+            self._hedge_stats['requests'] += 1
+        
+        done, pending = wait(futures, delay)
+        if done:
+            future = done.pop()
+            return (future.result() if future.exception() is None else None), 1
+        
+        with self._lock:
+            self._hedge_stats['triggered'] += 1
+        remaining = None if deadline is None else deadline.remaining()
+        futures[executor.submit(secondary.translate, text, remaining)] = True
+        
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, None if deadline is None else deadline.remaining(),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if futures[future]:
+                        with self._lock:
+                            self._hedge_stats['won'] += 1
+                    return future.result(), 2
+        
+        return None, 2
+    
+    def _backoff(self, attempt: int, deadline: Optional[Deadline]) -> bool:
+        delay = 0.5 * (attempt + 1)
+        if deadline is not None and deadline.remaining() <= delay:
+            return False
+        time.sleep(delay)
+        return True
+    
+    def translate_many(self, texts: List[str], retry: int = 3, max_segments: int = 100, workers: int = 1,
+                       progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        results = list(texts)
+        pending = {}
+        
+        for index, text in enumerate(texts):
+            if not isinstance(text, str) or not has_translatable_text(text):
                 continue
-            if re.match(r'["\'].*?["\']|`.*?`|\d+|[a-zA-Z_][a-zA-Z0-9_]*', part):
-                translated_parts.append(part)
+            prefix, stripped, suffix = _split_whitespace(text)
+            template = extract_template(stripped)
+            key = template.template if template is not None else stripped
+            pending.setdefault(key, []).append((index, template, prefix, suffix))
+        
+        translated = self._translate_keys(list(pending), retry, max_segments, workers, progress)
+        deadline = self._current_deadline()
+        
+        for key, targets in pending.items():
+            value = translated.get(key, key)
+            for index, template, prefix, suffix in targets:
+                result = value if template is None else template.render(value)
+                if result is None and deadline is not None and deadline.expired():
+                    result = texts[index].strip()
+                elif result is None:
+                    result = self._translate_text(texts[index].strip(), retry)
+                results[index] = prefix + result + suffix
+        
+        return results
+    
+    def _translate_keys(self, keys: List[str], retry: int = 3, max_segments: int = 100, workers: int = 1,
+                        progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, str]:
+        resolved = {}
+        misses = []
+        
+        for key in keys:
+            result = self._lookup_catalog(key)
+            if result is None:
+                result = self._cache.get(self._cache_key(key))
+            if result is None and self._negative.hit(self._cache_key(key)):
+                result = key
+            if result is None:
+                misses.append(key)
             else:
-                translated_parts.append(self.translate(part))
+                resolved[key] = result
+        
+        if progress:
+            progress(len(resolved), len(keys))
+        
+        deadline = self._current_deadline()
+        
+        for attempt in range(retry):
+            chunks = [misses[i:i + max_segments] for i in range(0, len(misses), max_segments)]
+            for chunk_resolved in self._run_chunks(chunks, max_segments, workers, deadline):
+                resolved.update(chunk_resolved)
+                if progress:
+                    progress(len(resolved), len(keys))
+            
+            misses = [key for key in misses if key not in resolved]
+            if not misses:
+                break
+            if attempt < retry - 1 and not self._backoff(attempt, deadline):
+                break
+        
+        if deadline is None or not deadline.expired():
+            for key in misses:
+                self._negative.add(self._cache_key(key))
+        
+        return resolved
+    
+    def _run_chunks(self, chunks: List[List[str]], max_segments: int, workers: int,
+                    deadline: Optional[Deadline] = None):
+        if workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                yield self._translate_chunk(chunk, max_segments, deadline)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = [executor.submit(self._translate_chunk, chunk, max_segments, deadline) for chunk in chunks]
+            for future in as_completed(futures):
+                yield future.result()
+    
+    def _translate_chunk(self, chunk: List[str], max_segments: int,
+                         deadline: Optional[Deadline] = None) -> Dict[str, str]:
+        resolved = {}
+        misses = chunk
+        
+        for engine_name, client in self._ranked_engines():
+            if not misses or (deadline is not None and deadline.expired()):
+                break
+            try:
+                batch = client.translate_batch(misses, max_segments, None if deadline is None else deadline.remaining())
+            except Exception:
+                continue
+            
+            remaining = []
+            for key, result in zip(misses, batch):
+                if result is None:
+                    remaining.append(key)
+                else:
+                    resolved[key] = self._store(self._cache_key(key), key, result)
+            misses = remaining
+        
+        return resolved
+    
+    def translate_parts(self, text: str) -> str:
+        if not text or not has_translatable_text(text):
+            return text
+        
+        prefix, stripped, suffix = _split_whitespace(text)
+        template = extract_template(stripped)
+        if template is None:
+            return prefix + self.translate(stripped) + suffix
         
-        return ''.join(translated_parts)
+        result = template.render(self.translate(template.template))
+        if result is None:
+            return text
+        return prefix + result + suffix
     
     def clear_cache(self):
         with self._lock:
             self._cache.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        if hasattr(self._cache, 'get_stats'):
+            stats = self._cache.get_stats()
+        else:
+            stats = {'entries': len(self._cache)}
+        stats['negative'] = self._negative.get_stats()
+        return stats
 
 
 class MultiEngineTranslator(Translator):
@@ -102,96 +397,75 @@ class MultiEngineTranslator(Translator):
         self.active_engines = engines or ['google', 'mymemory', 'libre']
         self._performance_metrics = {}
         
-    def translate_with_consensus(self, text: str) -> str:
-        results = []
-        for engine_name, engine_class in self._engines:
-            if engine_name in self.active_engines:
-                try:
-                    translator = engine_class(source=self.source_language, target=self.target_language)
-                    result = translator.translate(text)
-                    results.append(result)
-                except:
-                    continue
+    def translate_with_consensus(self, text: str, quorum: int = 2, timeout: Optional[float] = None) -> str:
+        clients = [client for engine_name, client in self._ranked_engines() if engine_name in self.active_engines]
+        groups = {}
         
-        if not results:
+        with self.deadline(timeout) as deadline:
+            remaining = None if deadline is None else deadline.remaining()
+            executor = self._registry.get_executor('consensus')
+            pending = {executor.submit(client.translate, text, remaining) for client in clients}
+            quorum = min(quorum, len(pending))
+            
+            while pending:
+                done, pending = wait(pending, None if deadline is None else deadline.remaining(),
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    if future.exception() is not None or not future.result():
+                        continue
+                    result = future.result()
+                    agreeing = groups.setdefault(_normalize_translation(result), [])
+                    agreeing.append(result)
+                    if len(agreeing) >= quorum:
+                        for loser in pending:
+                            loser.cancel()
+                        return agreeing[0]
+            
+            if groups:
+                return max(groups.values(), key=len)[0]
+            if deadline is not None and deadline.expired():
+                return text
             return self.translate(text)
-        
-        from collections import Counter
-        counter = Counter(results)
-        return counter.most_common(1)[0][0]
     
     def get_performance_metrics(self) -> Dict[str, Any]:
+        metrics = self._registry.get_performance_metrics()
+        self._performance_metrics = {name: metrics[name] for name in self.active_engines if name in metrics}
         return self._performance_metrics
 
 
 class CachedTranslator(Translator):
-    def __init__(self, target_language: str = 'ar', cache_size: int = 10000):
+    def __init__(self, target_language: str = 'ar', cache_size: int = 10000, max_bytes: Optional[int] = None,
+                 stripes: int = 16):
         super().__init__(target_language)
         self.cache_size = cache_size
-        self._access_count = {}
-        self._cache_hits = 0
-        self._cache_misses = 0
-        
-    @lru_cache(maxsize=10000)
-    def _cached_translate(self, text: str) -> str:
-        return super().translate(text)
-    
-    def translate(self, text: str, retry: int = 3) -> str:
-        cache_key = f"{self.source_language}:{self.target_language}:{text}"
-        
-        if cache_key in self._cache:
-            self._cache_hits += 1
-            return self._cache[cache_key]
-        
-        self._cache_misses += 1
-        result = self._cached_translate(text)
-        
-        if len(self._cache) >= self.cache_size:
-            self._evict_lru()
-        
-        self._cache[cache_key] = result
-        return result
+        self._cache = StripedLRUCache(max_entries=cache_size, max_bytes=max_bytes, stripes=stripes)
     
-    def _evict_lru(self):
-        if self._access_count:
-            lru_key = min(self._access_count, key=self._access_count.get)
-            del self._cache[lru_key]
-            del self._access_count[lru_key]
-    
-    def get_cache_stats(self) -> Dict[str, int]:
-        return {
-            'hits': self._cache_hits,
-            'misses': self._cache_misses,
-            'size': len(self._cache),
-            'hit_rate': self._cache_hits / (self._cache_hits + self._cache_misses) if (self._cache_hits + self._cache_misses) > 0 else 0
-        }
+    def get_cache_stats(self) -> Dict[str, Any]:
+        stats = super().get_cache_stats()
+        stats['size'] = stats['entries']
+        return stats
 
 
 class BatchTranslator(Translator):
-    def __init__(self, target_language: str = 'ar', batch_size: int = 100):
+    def __init__(self, target_language: str = 'ar', batch_size: int = 100, workers: int = 1):
         super().__init__(target_language)
         self.batch_size = batch_size
+        self.workers = workers
         self._pending_translations = []
         
     def add_to_batch(self, text: str) -> None:
         self._pending_translations.append(text)
     
-    def translate_batch(self) -> List[str]:
-        results = []
-        for text in self._pending_translations:
-            results.append(self.translate(text))
+    def translate_batch(self, progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        results = self.translate_many(self._pending_translations, max_segments=self.batch_size,
+                                      workers=self.workers, progress=progress)
         self._pending_translations.clear()
         return results
     
-    def auto_translate_batch(self, texts: List[str]) -> List[str]:
-        batches = [texts[i:i+self.batch_size] for i in range(0, len(texts), self.batch_size)]
-        all_results = []
-        
-        for batch in batches:
-            batch_results = [self.translate(text) for text in batch]
-            all_results.extend(batch_results)
-        
-        return all_results
+    def auto_translate_batch(self, texts: List[str], progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        return self.translate_many(texts, max_segments=self.batch_size, workers=self.workers, progress=progress)
 
 
 class OfflineTranslator(Translator):
@@ -249,10 +523,9 @@ class AdaptiveTranslator(Translator):
         return result, quality_score
     
     def _translate_with_engine(self, text: str, engine: str) -> str:
-        for engine_name, engine_class in self._engines:
+        for engine_name, client in self._engines:
             if engine_name == engine:
-                translator = engine_class(source=self.source_language, target=self.target_language)
-                return translator.translate(text)
+                return client.translate(text)
         return text
     
     def _assess_quality(self, original: str, translated: str) -> float:
@@ -345,3 +618,9 @@ class SmartTranslator(Translator):
         if text in self._preferences:
             return self._preferences[text]
         return super().translate(text, retry)
+    
+    def translate_many(self, texts: List[str], retry: int = 3, max_segments: int = 100, workers: int = 1,
+                       progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        pending = [None if text in self._preferences else text for text in texts]
+        results = super().translate_many(pending, retry, max_segments, workers, progress)
+        return [self._preferences.get(text, result) for text, result in zip(texts, results)]
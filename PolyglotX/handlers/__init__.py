@@ -1,4 +1,22 @@
-from PolyglotX.handlers.error_formatter import *
-from PolyglotX.handlers.output_handler import *
-from PolyglotX.handlers.signal_handler import *
-from PolyglotX.handlers.hook_manager import *
+from PolyglotX.utils.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    'PolyglotX.handlers.error_formatter': [
+        'ErrorFormatter', 'ColoredErrorFormatter', 'HTMLErrorFormatter',
+        'JSONErrorFormatter', 'XMLErrorFormatter', 'MarkdownErrorFormatter',
+        'PlainTextErrorFormatter', 'RichErrorFormatter', 'CompactErrorFormatter',
+        'VerboseErrorFormatter'
+    ],
+    'PolyglotX.handlers.output_handler': [
+        'OutputHandler', 'ConsoleOutputHandler', 'FileOutputHandler',
+        'SyslogOutputHandler', 'EmailOutputHandler', 'WebhookOutputHandler',
+        'DatabaseOutputHandler', 'StreamOutputHandler', 'BufferedOutputHandler',
+        'AsyncOutputHandler'
+    ],
+    'PolyglotX.handlers.signal_handler': ['SignalHandler', 'InterruptHandler'],
+    'PolyglotX.handlers.hook_manager': ['HookManager', 'ExceptionHookManager'],
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
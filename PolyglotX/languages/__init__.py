@@ -1,11 +1,19 @@
-from PolyglotX.languages.arbe import arbe
-from PolyglotX.languages.tr import tr
-from PolyglotX.languages.ja import ja
-from PolyglotX.languages.zh import zh
-from PolyglotX.languages.ku import ku
-from PolyglotX.languages.es import es
-from PolyglotX.languages.hi import hi
-from PolyglotX.languages.fr import fr
-from PolyglotX.languages.ru import ru
-from PolyglotX.languages.de import de
-from PolyglotX.languages.pt import pt
+from PolyglotX.utils.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    'PolyglotX.languages.arbe': ['arbe'],
+    'PolyglotX.languages.tr': ['tr'],
+    'PolyglotX.languages.ja': ['ja'],
+    'PolyglotX.languages.zh': ['zh'],
+    'PolyglotX.languages.ku': ['ku'],
+    'PolyglotX.languages.es': ['es'],
+    'PolyglotX.languages.hi': ['hi'],
+    'PolyglotX.languages.fr': ['fr'],
+    'PolyglotX.languages.ru': ['ru'],
+    'PolyglotX.languages.de': ['de'],
+    'PolyglotX.languages.pt': ['pt'],
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = ['arbe', 'tr', 'ja', 'zh', 'ku', 'es', 'hi', 'fr', 'ru', 'de', 'pt']
@@ -1,4 +1,25 @@
-from PolyglotX.translators.engine_manager import *
-from PolyglotX.translators.cache_manager import *
-from PolyglotX.translators.quality_checker import *
-from PolyglotX.translators.fallback_handler import *
+from PolyglotX.utils.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    'PolyglotX.translators.engine_manager': [
+        'TranslationEngine', 'RegistryEngine', 'GoogleEngine', 'DeepLEngine', 'LibreEngine',
+        'MyMemoryEngine', 'PonsEngine', 'LingueeEngine', 'YandexEngine',
+        'BingEngine', 'PapagoEngine'
+    ],
+    'PolyglotX.translators.connection_pool': ['ConnectionPool'],
+    'PolyglotX.translators.http_engines': [
+        'EngineError', 'EngineInputError', 'HTTPEngine', 'GoogleHTTPEngine', 'MyMemoryHTTPEngine', 'LibreHTTPEngine'
+    ],
+    'PolyglotX.translators.engine_health': ['EngineHealth'],
+    'PolyglotX.translators.engine_registry': ['EngineClient', 'EngineRegistry', 'get_engine_registry'],
+    'PolyglotX.translators.memory_cache': ['LRUCache', 'StripedLRUCache', 'NegativeCache'],
+    'PolyglotX.translators.cache_manager': ['CacheManager', 'TTLCache'],
+    'PolyglotX.translators.sqlite_cache': ['SQLiteCache'],
+    'PolyglotX.translators.tiered_cache': ['TieredCache'],
+    'PolyglotX.translators.quality_checker': ['QualityChecker'],
+    'PolyglotX.translators.fallback_handler': ['FallbackHandler', 'ChainedFallback'],
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
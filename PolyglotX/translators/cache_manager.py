@@ -1,70 +1,262 @@
 import json
 import os
 import pickle
+import time
+import heapq
 import threading
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Callable
+from datetime import datetime
+
+
+_LOG_HEADER = '{"format": "polyglotx-cache", "version": 1}\n'
+_MISSING = object()
 
 
 class CacheManager:
-    def __init__(self, cache_file: str = '.polyglotx_cache.json'):
+    def __init__(self, cache_file: str = '.polyglotx_cache.json', compact_ratio: float = 2.0,
+                 compact_min: int = 1000, sync: bool = False):
         self.cache_file = cache_file
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+        self.sync = sync
+        self._handle = None
+        self._records = 0
+        self.corrupt_records = 0
+        self._needs_compaction = False
+        self.lock = threading.RLock()
         self.cache = self._load_cache()
-        self.lock = threading.Lock()
+        if self._needs_compaction:
+            self._compact()
         
     def _load_cache(self) -> Dict[str, Any]:
-        if os.path.exists(self.cache_file):
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return {}
+        
+        header = _LOG_HEADER.encode('utf-8')
+        if not data.startswith(header):
+            try:
+                legacy = json.loads(data.decode('utf-8'))
+            except ValueError:
+                legacy = None
+            self._needs_compaction = True
+            return legacy if isinstance(legacy, dict) else {}
+        
+        cache = {}
+        offset = len(header)
+        while offset < len(data):
+            end = data.find(b'\n', offset)
+            if end < 0:
+                break
+            offset, line = end + 1, data[offset:end]
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+                record = json.loads(line.decode('utf-8'))
+                key = record['k']
+                if record.get('d'):
+                    cache.pop(key, None)
+                else:
+                    cache[key] = record['v']
+            except (ValueError, TypeError, KeyError, AttributeError):
+                self.corrupt_records += 1
+                self._needs_compaction = True
+                continue
+            self._records += 1
+        
+        if offset < len(data):
+            with open(self.cache_file, 'r+b') as f:
+                f.truncate(offset)
+        return cache
+    
+    def _open(self) -> Any:
+        if self._handle is None:
+            fresh = not os.path.exists(self.cache_file) or os.path.getsize(self.cache_file) == 0
+            self._handle = open(self.cache_file, 'a', encoding='utf-8', newline='\n')
+            if fresh:
+                self._handle.write(_LOG_HEADER)
+        return self._handle
+    
+    def _append(self, record: Dict[str, Any]):
+        handle = self._open()
+        handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+        handle.flush()
+        if self.sync:
+            os.fsync(handle.fileno())
+        self._records += 1
+        if self._records >= self.compact_min and self._records > self.compact_ratio * len(self.cache):
+            self._compact()
+    
+    def _write(self, key: str, value: Any):
+        self.cache[key] = value
+        self._append({'k': key, 'v': value})
+    
+    def _delete(self, key: str):
+        if self.cache.pop(key, _MISSING) is not _MISSING:
+            self._append({'k': key, 'd': 1})
     
-    def _save_cache(self):
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+    def _compact(self):
+        temp_file = self.cache_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(_LOG_HEADER)
+            for key, value in self.cache.items():
+                f.write(json.dumps({'k': key, 'v': value}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self._close_handle()
+        os.replace(temp_file, self.cache_file)
+        self._records = len(self.cache)
+        self._needs_compaction = False
     
-    def get(self, key: str) -> Optional[str]:
+    def compact(self):
         with self.lock:
-            return self.cache.get(key)
+            self._compact()
+    
+    def _close_handle(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+    
+    def close(self):
+        with self.lock:
+            self._close_handle()
+    
+    def get(self, key: str, default: Any = None) -> Optional[str]:
+        with self.lock:
+            return self.cache.get(key, default)
     
     def set(self, key: str, value: str):
         with self.lock:
-            self.cache[key] = value
-            self._save_cache()
+            self._write(key, value)
+    
+    def delete(self, key: str):
+        with self.lock:
+            self._delete(key)
     
     def clear(self):
         with self.lock:
             self.cache.clear()
-            self._save_cache()
+            self._compact()
     
     def size(self) -> int:
         with self.lock:
             return len(self.cache)
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any):
+        self.set(key, value)
+    
+    def __delitem__(self, key: str):
+        self.delete(key)
+    
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            return key in self.cache
+    
+    def __len__(self) -> int:
+        return self.size()
 
 
 class TTLCache(CacheManager):
-    def __init__(self, cache_file: str = '.polyglotx_ttl_cache.json', ttl: int = 3600):
-        super().__init__(cache_file)
+    def __init__(self, cache_file: str = '.polyglotx_ttl_cache.json', ttl: int = 3600,
+                 sweep_interval: Optional[float] = 60.0, stale_ttl: float = 0.0,
+                 refresh: Optional[Callable[[str], Any]] = None):
         self.ttl = ttl
-        
-    def get(self, key: str) -> Optional[str]:
+        self.stale_ttl = stale_ttl
+        self.refresh = refresh
+        self.sweep_interval = sweep_interval
+        self._heap = []
+        self._refreshing = set()
+        self._stop = threading.Event()
+        self._sweeper = None
+        super().__init__(cache_file)
+        self._index_expiry()
+        if sweep_interval:
+            self._sweeper = threading.Thread(target=self._sweep_loop, name='polyglotx-ttl-sweeper', daemon=True)
+            self._sweeper.start()
+    
+    def _index_expiry(self):
         with self.lock:
-            if key in self.cache:
-                entry = self.cache[key]
-                if isinstance(entry, dict) and 'value' in entry and 'timestamp' in entry:
-                    timestamp = datetime.fromisoformat(entry['timestamp'])
-                    if datetime.now() - timestamp < timedelta(seconds=self.ttl):
-                        return entry['value']
-                    else:
-                        del self.cache[key]
-            return None
+            for key, entry in list(self.cache.items()):
+                if isinstance(entry, dict) and 'timestamp' in entry and 'expires' not in entry:
+                    try:
+                        created = datetime.fromisoformat(entry['timestamp']).timestamp()
+                    except (TypeError, ValueError):
+                        created = 0.0
+                    entry = {'value': entry.get('value'), 'expires': created + self.ttl}
+                    self.cache[key] = entry
+                    self._needs_compaction = True
+                if isinstance(entry, dict) and 'expires' in entry:
+                    heapq.heappush(self._heap, (entry['expires'] + self.stale_ttl, key))
+            if self._needs_compaction:
+                self._compact()
     
-    def set(self, key: str, value: str):
+    def get(self, key: str, default: Any = None) -> Optional[str]:
         with self.lock:
-            self.cache[key] = {
-                'value': value,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._save_cache()
+            entry = self.cache.get(key)
+            if not isinstance(entry, dict) or 'expires' not in entry:
+                return default
+            now = time.time()
+            if now < entry['expires']:
+                return entry['value']
+            if self.refresh is not None and now < entry['expires'] + self.stale_ttl:
+                self._schedule_refresh(key)
+                return entry['value']
+            self._delete(key)
+            return default
+    
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        with self.lock:
+            self._write(key, {'value': value, 'expires': expires})
+            heapq.heappush(self._heap, (expires + self.stale_ttl, key))
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def _schedule_refresh(self, key: str):
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        threading.Thread(target=self._refresh_entry, args=(key,), daemon=True).start()
+    
+    def _refresh_entry(self, key: str):
+        try:
+            value = self.refresh(key)
+            if value is not None:
+                self.set(key, value)
+        except Exception:
+            pass
+        finally:
+            with self.lock:
+                self._refreshing.discard(key)
+    
+    def sweep(self) -> int:
+        removed = 0
+        now = time.time()
+        with self.lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, key = heapq.heappop(self._heap)
+                entry = self.cache.get(key)
+                if isinstance(entry, dict) and entry.get('expires', 0) + self.stale_ttl <= now:
+                    self._delete(key)
+                    removed += 1
+        return removed
+    
+    def _sweep_loop(self):
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except Exception:
+                pass
+    
+    def close(self):
+        self._stop.set()
+        super().close()
@@ -0,0 +1,71 @@
+import threading
+from typing import Dict, Any, Optional
+
+
+class ConnectionPool:
+    def __init__(self, pool_size: int = 10, timeout: float = 10.0, keep_alive: bool = True):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self._session = None
+        self._lock = threading.Lock()
+        self._requests = 0
+
+    def _create_session(self) -> Any:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive' if self.keep_alive else 'close'
+        return session
+
+    @property
+    def session(self) -> Any:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs) -> Any:
+        with self._lock:
+            self._requests += 1
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        return self.session.request(method, url, timeout=timeout, **kwargs)
+
+    def get(self, url: str, **kwargs) -> Any:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        return self.request('POST', url, **kwargs)
+
+    def configure(self, pool_size: Optional[int] = None, timeout: Optional[float] = None,
+                  keep_alive: Optional[bool] = None):
+        with self._lock:
+            if pool_size is not None:
+                self.pool_size = pool_size
+            if timeout is not None:
+                self.timeout = timeout
+            if keep_alive is not None:
+                self.keep_alive = keep_alive
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'pool_size': self.pool_size,
+                'timeout': self.timeout,
+                'keep_alive': self.keep_alive,
+                'requests': self._requests
+            }
+
+    def close(self):
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
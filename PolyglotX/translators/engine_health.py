@@ -0,0 +1,118 @@
+import time
+import threading
+from collections import deque
+from typing import Dict, Any, Optional
+
+
+class EngineHealth:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, alpha: float = 0.2, failure_threshold: int = 3, cooldown: float = 30.0, window: int = 100,
+                 prior_latency: float = 1.0):
+        self.alpha = alpha
+        self.prior_latency = prior_latency
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.latency = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                return time.monotonic() - self._opened_at >= self.cooldown
+            return not self._probing
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self, latency: float):
+        with self._lock:
+            self._record(latency, False)
+            self._samples.append(latency)
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+            self._probing = False
+
+    def abandon(self):
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self, latency: Optional[float] = None):
+        with self._lock:
+            if latency is not None:
+                latency = max(latency, self.prior_latency if self.latency is None else self.latency)
+            self._record(latency, True)
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def _record(self, latency: Optional[float], failed: bool):
+        self.requests += 1
+        self.error_rate += self.alpha * ((1.0 if failed else 0.0) - self.error_rate)
+        if latency is not None:
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.alpha * (latency - self.latency)
+
+    def expected_cost(self) -> float:
+        with self._lock:
+            latency = self.prior_latency if self.latency is None else self.latency
+            return latency / max(1.0 - self.error_rate, 0.05)
+
+    def percentile(self, q: float) -> Optional[float]:
+        with self._lock:
+            return self._percentile_unlocked(q)
+
+    def _percentile_unlocked(self, q: float) -> Optional[float]:
+        if len(self._samples) < 5:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * q / 100.0))]
+
+    def reset(self):
+        with self._lock:
+            self.latency = None
+            self.error_rate = 0.0
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+            self._probing = False
+            self._samples.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'state': self.state,
+                'latency': self.latency,
+                'p95': self._percentile_unlocked(95),
+                'error_rate': self.error_rate,
+                'requests': self.requests,
+                'failures': self.failures,
+                'consecutive_failures': self.consecutive_failures
+            }
@@ -1,50 +1,59 @@
 from typing import Optional, Dict, Any, List
-from deep_translator import GoogleTranslator, MyMemoryTranslator, LibreTranslator
 import time
+from PolyglotX.translators.engine_registry import get_engine_registry
 
 
 class TranslationEngine:
     def __init__(self, source: str = 'auto', target: str = 'ar'):
         self.source = source
         self.target = target
+        self._translator = None
         
     def translate(self, text: str) -> str:
         raise NotImplementedError
+    
+    def _get_translator(self, factory: Any, **kwargs) -> Any:
+        if self._translator is None:
+            self._translator = factory(source=self.source, target=self.target, **kwargs)
+        return self._translator
 
 
-class GoogleEngine(TranslationEngine):
+class RegistryEngine(TranslationEngine):
+    engine_name = ''
+    
     def translate(self, text: str) -> str:
-        translator = GoogleTranslator(source=self.source, target=self.target)
-        return translator.translate(text)
+        if self._translator is None:
+            self._translator = get_engine_registry().get_client(self.engine_name, self.source, self.target)
+        return self._translator.translate(text)
+
+
+class GoogleEngine(RegistryEngine):
+    engine_name = 'google'
 
 
 class DeepLEngine(TranslationEngine):
     def translate(self, text: str) -> str:
         try:
-            from deep_translator import DeepL
-            translator = DeepL(source=self.source, target=self.target, use_free_api=True)
+            from deep_translator import DeeplTranslator
+            translator = self._get_translator(DeeplTranslator, use_free_api=True)
             return translator.translate(text)
         except:
             return GoogleEngine(self.source, self.target).translate(text)
 
 
-class LibreEngine(TranslationEngine):
-    def translate(self, text: str) -> str:
-        translator = LibreTranslator(source=self.source, target=self.target)
-        return translator.translate(text)
+class LibreEngine(RegistryEngine):
+    engine_name = 'libre'
 
 
-class MyMemoryEngine(TranslationEngine):
-    def translate(self, text: str) -> str:
-        translator = MyMemoryTranslator(source=self.source, target=self.target)
-        return translator.translate(text)
+class MyMemoryEngine(RegistryEngine):
+    engine_name = 'mymemory'
 
 
 class PonsEngine(TranslationEngine):
     def translate(self, text: str) -> str:
         try:
             from deep_translator import PonsTranslator
-            translator = PonsTranslator(source=self.source, target=self.target)
+            translator = self._get_translator(PonsTranslator)
             return translator.translate(text)
         except:
             return GoogleEngine(self.source, self.target).translate(text)
@@ -54,7 +63,7 @@ class LingueeEngine(TranslationEngine):
     def translate(self, text: str) -> str:
         try:
             from deep_translator import LingueeTranslator
-            translator = LingueeTranslator(source=self.source, target=self.target)
+            translator = self._get_translator(LingueeTranslator)
             return translator.translate(text)
         except:
             return GoogleEngine(self.source, self.target).translate(text)
@@ -64,7 +73,7 @@ class YandexEngine(TranslationEngine):
     def translate(self, text: str) -> str:
         try:
             from deep_translator import YandexTranslator
-            translator = YandexTranslator(source=self.source, target=self.target)
+            translator = self._get_translator(YandexTranslator)
             return translator.translate(text)
         except:
             return GoogleEngine(self.source, self.target).translate(text)
@@ -74,7 +83,7 @@ class BingEngine(TranslationEngine):
     def translate(self, text: str) -> str:
         try:
             from deep_translator import MicrosoftTranslator
-            translator = MicrosoftTranslator(source=self.source, target=self.target)
+            translator = self._get_translator(MicrosoftTranslator)
             return translator.translate(text)
         except:
             return GoogleEngine(self.source, self.target).translate(text)
@@ -83,8 +92,7 @@ class BingEngine(TranslationEngine):
 class PapagoEngine(TranslationEngine):
     def translate(self, text: str) -> str:
         try:
-            from translatepy import Translate
-            t = Translate()
+            t = get_engine_registry().get_translatepy()
             result = t.translate(text, self.target)
             return result.result
         except:
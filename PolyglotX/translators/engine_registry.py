@@ -0,0 +1,344 @@
+import os
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Callable, Optional
+from PolyglotX.translators.connection_pool import ConnectionPool
+from PolyglotX.translators.engine_health import EngineHealth
+from PolyglotX.translators.memory_cache import StripedLRUCache, NegativeCache
+from PolyglotX.translators.sqlite_cache import SQLiteCache
+from PolyglotX.translators.tiered_cache import TieredCache
+from PolyglotX.translators.http_engines import EngineError, EngineInputError, HTTPEngine, GoogleHTTPEngine, MyMemoryHTTPEngine, LibreHTTPEngine
+
+
+def _pons_factory(source: str, target: str) -> Any:
+    from deep_translator import PonsTranslator
+    return PonsTranslator(source=source, target=target)
+
+
+def _linguee_factory(source: str, target: str) -> Any:
+    from deep_translator import LingueeTranslator
+    return LingueeTranslator(source=source, target=target)
+
+
+_CACHE_TTL = 30 * 24 * 3600
+_CACHE_MAX_ENTRIES = 100000
+
+
+def _default_cache() -> TieredCache:
+    l1 = StripedLRUCache(max_entries=10000, max_bytes=32 * 1024 * 1024)
+    path = os.environ.get('POLYGLOTX_CACHE_FILE')
+    if path is None:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        path = os.path.join(base, 'polyglotx', 'translations.sqlite3')
+    if not path:
+        return TieredCache(l1)
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        l2 = SQLiteCache(path, ttl=_CACHE_TTL, max_entries=_CACHE_MAX_ENTRIES)
+        l2.trim()
+        return TieredCache(l1, l2)
+    except (OSError, sqlite3.Error):
+        return TieredCache(l1)
+
+
+class EngineClient:
+    def __init__(self, name: str, factory: Callable[[str, str], Any], source: str = 'auto',
+                 target: str = 'ar', max_idle: int = 10, max_concurrency: int = 10,
+                 health: Optional[EngineHealth] = None):
+        self.name = name
+        self.source = source
+        self.target = target
+        self.max_idle = max_idle
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self.health = health or EngineHealth()
+        self._factory = factory
+        self._idle = []
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> Any:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        return self._factory(self.source, self.target)
+
+    def _release(self, engine: Any):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(engine)
+
+    def _take_slot(self, timeout: Optional[float]) -> Optional[threading.BoundedSemaphore]:
+        slots = self._slots
+        if slots.acquire(timeout=None if timeout is None else max(timeout, 0.0)):
+            return slots
+        return None
+
+    def translate(self, text: str, timeout: Optional[float] = None) -> str:
+        start = time.monotonic()
+        slots = self._take_slot(timeout)
+        if slots is None:
+            raise EngineError(f"{self.name}: no free slot within the deadline")
+        if timeout is not None:
+            timeout -= time.monotonic() - start
+            if timeout <= 0:
+                slots.release()
+                raise EngineError(f"{self.name}: no free slot within the deadline")
+        try:
+            engine = self._acquire()
+            try:
+                if timeout is not None and not isinstance(engine, HTTPEngine):
+                    raise EngineError(f"{self.name}: cannot honour a deadline")
+                if not self.health.allow():
+                    raise EngineError(f"{self.name}: circuit open")
+                start = time.monotonic()
+                try:
+                    result = engine.translate(text) if timeout is None else engine.translate(text, timeout)
+                except EngineInputError:
+                    self.health.abandon()
+                    raise
+                except Exception:
+                    self._record_failure(engine, timeout, time.monotonic() - start)
+                    raise
+                self.health.record_success(time.monotonic() - start)
+                return result
+            finally:
+                self._release(engine)
+        finally:
+            slots.release()
+
+    def translate_batch(self, texts: List[str], max_segments: int = 100,
+                        timeout: Optional[float] = None) -> List[Optional[str]]:
+        start = time.monotonic()
+        slots = self._take_slot(timeout)
+        if slots is None:
+            return [None] * len(texts)
+        if timeout is not None:
+            timeout -= time.monotonic() - start
+            if timeout <= 0:
+                slots.release()
+                return [None] * len(texts)
+        try:
+            engine = self._acquire()
+            try:
+                if timeout is not None and not isinstance(engine, HTTPEngine):
+                    return [None] * len(texts)
+                if not self.health.allow():
+                    return [None] * len(texts)
+                limit = getattr(engine, 'max_chars', None)
+                sendable = [index for index, text in enumerate(texts) if limit is None or len(text) <= limit]
+                results = [None] * len(texts)
+                if not sendable:
+                    self.health.abandon()
+                    return results
+                start = time.monotonic()
+                try:
+                    translated = self._translate_batch(engine, [texts[index] for index in sendable], max_segments,
+                                                       timeout)
+                except Exception:
+                    self._record_failure(engine, timeout, time.monotonic() - start)
+                    raise
+                for index, result in zip(sendable, translated):
+                    results[index] = result
+                if any(result is not None for result in translated):
+                    self.health.record_success(time.monotonic() - start)
+                else:
+                    self._record_failure(engine, timeout, time.monotonic() - start)
+                return results
+            finally:
+                self._release(engine)
+        finally:
+            slots.release()
+
+    def _record_failure(self, engine: Any, timeout: Optional[float], elapsed: float):
+        pool = getattr(engine, 'pool', None)
+        if timeout is not None and elapsed >= timeout and (pool is None or timeout < pool.timeout):
+            self.health.abandon()
+        else:
+            self.health.record_failure(elapsed)
+
+    def _translate_batch(self, engine: Any, texts: List[str], max_segments: int,
+                         timeout: Optional[float] = None) -> List[Optional[str]]:
+        if isinstance(engine, HTTPEngine):
+            return engine.translate_batch(texts, max_segments, timeout)
+        results = []
+        for text in texts:
+            try:
+                results.append(engine.translate(text) or None)
+            except Exception:
+                results.append(None)
+        return results
+
+    def set_concurrency(self, limit: int):
+        with self._lock:
+            self.max_concurrency = limit
+            self._slots = threading.BoundedSemaphore(limit)
+
+    def reset(self, factory: Optional[Callable[[str, str], Any]] = None):
+        with self._lock:
+            if factory is not None:
+                self._factory = factory
+            self._idle.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'created': self._created, 'idle': len(self._idle), 'max_concurrency': self.max_concurrency}
+
+
+class EngineRegistry:
+    def __init__(self, pool_size: int = 10, timeout: float = 10.0):
+        self.pool = ConnectionPool(pool_size=pool_size, timeout=timeout)
+        self._base_urls = {}
+        self._concurrency = {}
+        self._health = {}
+        self._factories = {}
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._translatepy = None
+        self._executors = {}
+        self.cache = _default_cache()
+        self.cache_lock = threading.Lock()
+        self.inflight = {}
+        self.negative_cache = NegativeCache()
+        self._register_default_engines()
+
+    def _register_default_engines(self):
+        self.register_engine('google', self._http_factory(GoogleHTTPEngine))
+        self.register_engine('mymemory', self._http_factory(MyMemoryHTTPEngine))
+        self.register_engine('libre', self._http_factory(LibreHTTPEngine))
+        self.register_engine('pons', _pons_factory)
+        self.register_engine('linguee', _linguee_factory)
+
+    def _http_factory(self, engine_class: Any) -> Callable[[str, str], Any]:
+        def factory(source: str, target: str) -> Any:
+            return engine_class(self.pool, source, target, base_url=self._base_urls.get(engine_class.name))
+        return factory
+
+    def _reset_clients(self, name: str):
+        for key, client in self._clients.items():
+            if key[0] == name:
+                client.reset(self._factories[name])
+
+    def register_engine(self, name: str, factory: Callable[[str, str], Any]):
+        with self._lock:
+            self._factories[name] = factory
+            self._health.setdefault(name, EngineHealth())
+            self._reset_clients(name)
+
+    def set_base_url(self, name: str, base_url: Optional[str]):
+        with self._lock:
+            if base_url:
+                self._base_urls[name] = base_url
+            else:
+                self._base_urls.pop(name, None)
+            self._reset_clients(name)
+
+    def set_concurrency(self, name: str, limit: Optional[int]):
+        with self._lock:
+            if limit:
+                self._concurrency[name] = limit
+            else:
+                self._concurrency.pop(name, None)
+            for key, client in self._clients.items():
+                if key[0] == name:
+                    client.set_concurrency(self._concurrency.get(name, self.pool.pool_size))
+
+    def set_cache(self, cache: Any):
+        with self.cache_lock:
+            self.cache = cache
+
+    def configure_pool(self, pool_size: Optional[int] = None, timeout: Optional[float] = None,
+                       keep_alive: Optional[bool] = None):
+        self.pool.configure(pool_size=pool_size, timeout=timeout, keep_alive=keep_alive)
+        with self._lock:
+            for (name, _, _), client in self._clients.items():
+                client.max_idle = self.pool.pool_size
+                if name not in self._concurrency and client.max_concurrency != self.pool.pool_size:
+                    client.set_concurrency(self.pool.pool_size)
+
+    def engine_names(self) -> List[str]:
+        with self._lock:
+            return list(self._factories)
+
+    def get_client(self, engine: str, source: str = 'auto', target: str = 'ar') -> EngineClient:
+        key = (engine, source, target)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = EngineClient(engine, self._factories[engine], source, target, max_idle=self.pool.pool_size,
+                                      max_concurrency=self._concurrency.get(engine, self.pool.pool_size),
+                                      health=self._health[engine])
+                self._clients[key] = client
+            return client
+
+    def get_clients(self, source: str = 'auto', target: str = 'ar') -> List[Tuple[str, EngineClient]]:
+        return [(name, self.get_client(name, source, target)) for name in self.engine_names()]
+
+    def rank_clients(self, clients: List[Tuple[str, EngineClient]]) -> List[Tuple[str, EngineClient]]:
+        available = [(name, client) for name, client in clients if client.health.available()]
+        return sorted(available, key=lambda item: item[1].health.expected_cost())
+
+    def get_health(self, name: str) -> EngineHealth:
+        with self._lock:
+            return self._health[name]
+
+    def get_performance_metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            health = dict(self._health)
+        return {name: engine_health.get_metrics() for name, engine_health in health.items()}
+
+    def get_translatepy(self) -> Any:
+        with self._lock:
+            if self._translatepy is None:
+                from translatepy import Translate
+                self._translatepy = Translate()
+            return self._translatepy
+
+    def get_executor(self, name: str = 'default') -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=self.pool.pool_size, thread_name_prefix=f'polyglotx-{name}')
+                self._executors[name] = executor
+            return executor
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            clients = len(self._clients)
+        with self.cache_lock:
+            cache_size = len(self.cache)
+            inflight = len(self.inflight)
+        return {
+            'engines': len(self._factories),
+            'clients': clients,
+            'cache_size': cache_size,
+            'inflight': inflight,
+            'negative': self.negative_cache.get_stats(),
+            'pool': self.pool.get_stats()
+        }
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+            self._translatepy = None
+            for engine_health in self._health.values():
+                engine_health.reset()
+        with self.cache_lock:
+            self.cache.clear()
+        self.negative_cache.clear()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_engine_registry() -> EngineRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = EngineRegistry()
+    return _registry
@@ -0,0 +1,164 @@
+import os
+import time
+from typing import Dict, Any, List, Optional
+from PolyglotX.translators.connection_pool import ConnectionPool
+
+
+class EngineError(Exception):
+    pass
+
+
+class EngineInputError(EngineError):
+    pass
+
+
+class HTTPEngine:
+    name = 'http'
+    base_url = ''
+    max_chars = 5000
+    delimiter = '\n'
+
+    def __init__(self, pool: ConnectionPool, source: str = 'auto', target: str = 'ar', base_url: Optional[str] = None):
+        self.pool = pool
+        self.source = source
+        self.target = target
+        if base_url:
+            self.base_url = base_url
+
+    def translate(self, text: str, timeout: Optional[float] = None) -> str:
+        if not text or not text.strip():
+            return text
+        if len(text) > self.max_chars:
+            raise EngineInputError(f"{self.name}: text longer than {self.max_chars} characters")
+
+        response = self._send(text, timeout)
+        if response.status_code == 429:
+            raise EngineError(f"{self.name}: too many requests")
+        if response.status_code >= 400:
+            raise EngineError(f"{self.name}: HTTP {response.status_code}")
+
+        result = self._parse(response.json())
+        if not result:
+            raise EngineError(f"{self.name}: empty translation")
+        return result
+
+    def translate_batch(self, texts: List[str], max_segments: int = 100,
+                        timeout: Optional[float] = None) -> List[Optional[str]]:
+        expires = None if timeout is None else time.monotonic() + timeout
+        results = []
+        for chunk in self._pack(texts, max_segments):
+            remaining = None if expires is None else expires - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                results.extend([None] * len(chunk))
+                continue
+            try:
+                results.extend(self._translate_chunk(chunk, remaining))
+            except Exception:
+                results.extend([None] * len(chunk))
+        return results
+
+    def _pack(self, texts: List[str], max_segments: int) -> List[List[str]]:
+        chunks = []
+        chunk = []
+        size = 0
+        for text in texts:
+            extra = len(text) + len(self.delimiter)
+            if chunk and (len(chunk) >= max_segments or size + extra > self.max_chars):
+                chunks.append(chunk)
+                chunk = []
+                size = 0
+            chunk.append(text)
+            size += extra
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _translate_chunk(self, chunk: List[str], timeout: Optional[float] = None) -> List[Optional[str]]:
+        if len(chunk) == 1 or any(self.delimiter in text for text in chunk):
+            return [self._translate_or_none(text, timeout) for text in chunk]
+
+        parts = self.translate(self.delimiter.join(chunk), timeout).split(self.delimiter)
+        if len(parts) != len(chunk):
+            return [self._translate_or_none(text, timeout) for text in chunk]
+        return [part.strip() or None for part in parts]
+
+    def _translate_or_none(self, text: str, timeout: Optional[float] = None) -> Optional[str]:
+        try:
+            return self.translate(text, timeout)
+        except Exception:
+            return None
+
+    def _send(self, text: str, timeout: Optional[float] = None) -> Any:
+        raise NotImplementedError
+
+    def _parse(self, data: Any) -> Optional[str]:
+        raise NotImplementedError
+
+
+class GoogleHTTPEngine(HTTPEngine):
+    name = 'google'
+    base_url = 'https://translate.googleapis.com/translate_a/single'
+
+    def _send(self, text: str, timeout: Optional[float] = None) -> Any:
+        params = {'client': 'gtx', 'sl': self.source, 'tl': self.target, 'dt': 't', 'q': text}
+        return self.pool.get(self.base_url, params=params, timeout=timeout)
+
+    def _parse(self, data: Any) -> Optional[str]:
+        if not data or not data[0]:
+            return None
+        return ''.join(segment[0] for segment in data[0] if segment and segment[0])
+
+
+class MyMemoryHTTPEngine(HTTPEngine):
+    name = 'mymemory'
+    base_url = 'https://api.mymemory.translated.net/get'
+    max_chars = 500
+
+    def _send(self, text: str, timeout: Optional[float] = None) -> Any:
+        source = 'en' if self.source == 'auto' else self.source
+        params = {'q': text, 'langpair': f"{source}|{self.target}"}
+        return self.pool.get(self.base_url, params=params, timeout=timeout)
+
+    def _parse(self, data: Dict[str, Any]) -> Optional[str]:
+        translation = (data.get('responseData') or {}).get('translatedText')
+        if translation:
+            return translation
+        for match in data.get('matches', []):
+            if match.get('translation'):
+                return match['translation']
+        return None
+
+
+class LibreHTTPEngine(HTTPEngine):
+    name = 'libre'
+    base_url = 'https://libretranslate.com/translate'
+
+    def __init__(self, pool: ConnectionPool, source: str = 'auto', target: str = 'ar',
+                 base_url: Optional[str] = None, api_key: Optional[str] = None):
+        super().__init__(pool, source, target, base_url)
+        self.api_key = api_key or os.environ.get('LIBRE_API_KEY')
+
+    def _send(self, text: str, timeout: Optional[float] = None) -> Any:
+        payload = {'q': text, 'source': self.source, 'target': self.target, 'format': 'text'}
+        if self.api_key:
+            payload['api_key'] = self.api_key
+        return self.pool.post(self.base_url, json=payload, timeout=timeout)
+
+    def _parse(self, data: Dict[str, Any]) -> Optional[str]:
+        return data.get('translatedText')
+
+    def _translate_chunk(self, chunk: List[str], timeout: Optional[float] = None) -> List[Optional[str]]:
+        if len(chunk) == 1:
+            return [self._translate_or_none(chunk[0], timeout)]
+
+        payload = {'q': chunk, 'source': self.source, 'target': self.target, 'format': 'text'}
+        if self.api_key:
+            payload['api_key'] = self.api_key
+        response = self.pool.post(self.base_url, json=payload, timeout=timeout)
+        if response.status_code >= 400:
+            raise EngineError(f"{self.name}: HTTP {response.status_code}")
+
+        translated = response.json().get('translatedText')
+        if not isinstance(translated, list) or len(translated) != len(chunk):
+            raise EngineError(f"{self.name}: malformed batch response")
+        return [text or None for text in translated]
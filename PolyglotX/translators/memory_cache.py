@@ -0,0 +1,261 @@
+import sys
+import time
+import random
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Hashable, Tuple, Callable
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, max_entries: int = 10000, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _sizeof(key: Hashable, value: Any) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        size = self._sizeof(key, value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def _evict(self):
+        while self._data and (len(self._data) > self.max_entries or
+                              (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def evict_oldest(self) -> Optional[int]:
+        with self._lock:
+            if not self._data:
+                return None
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            return size
+
+    def usage(self) -> Tuple[int, int]:
+        with self._lock:
+            return len(self._data), self._bytes
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable):
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return _stats(len(self._data), self._bytes, self.max_entries, self.max_bytes,
+                          self.hits, self.misses, self.evictions)
+
+
+class StripedLRUCache:
+    def __init__(self, max_entries: int = 10000, max_bytes: Optional[int] = None, stripes: int = 16):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        stripes = max(1, min(stripes, max_entries))
+        self._stripes = [LRUCache(max_entries, max_bytes) for _ in range(stripes)]
+        self._entries = 0
+        self._bytes = 0
+        self._victim = 0
+        self._lock = threading.Lock()
+
+    def _stripe(self, key: Hashable) -> LRUCache:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._stripe(key).get(key, default)
+
+    def _apply(self, stripe: LRUCache, operation: Callable[[], Any]) -> Any:
+        entries, size = stripe.usage()
+        result = operation()
+        new_entries, new_size = stripe.usage()
+        self._entries += new_entries - entries
+        self._bytes += new_size - size
+        return result
+
+    def put(self, key: Hashable, value: Any):
+        stripe = self._stripe(key)
+        with self._lock:
+            self._apply(stripe, lambda: stripe.put(key, value))
+            self._evict(stripe)
+
+    def _evict(self, preferred: LRUCache):
+        while self._entries > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+            victim = self._next_victim(preferred)
+            freed = None if victim is None else victim.evict_oldest()
+            if freed is None:
+                break
+            self._entries -= 1
+            self._bytes -= freed
+
+    def _next_victim(self, inserted: LRUCache) -> Optional[LRUCache]:
+        for _ in range(len(self._stripes)):
+            self._victim = (self._victim + 1) % len(self._stripes)
+            stripe = self._stripes[self._victim]
+            if len(stripe) > (1 if stripe is inserted else 0):
+                return stripe
+        return None
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        stripe = self._stripe(key)
+        with self._lock:
+            return self._apply(stripe, lambda: stripe.pop(key, default))
+
+    def clear(self):
+        with self._lock:
+            for stripe in self._stripes:
+                stripe.clear()
+            self._entries = 0
+            self._bytes = 0
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._stripe(key)[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable):
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._stripe(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        totals = {'entries': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0}
+        for stripe in self._stripes:
+            stats = stripe.get_stats()
+            for name in totals:
+                totals[name] += stats[name]
+        stats = _stats(totals['entries'], totals['bytes'], self.max_entries, self.max_bytes,
+                       totals['hits'], totals['misses'], totals['evictions'])
+        stats['stripes'] = len(self._stripes)
+        return stats
+
+
+def _stats(entries: int, size: int, max_entries: int, max_bytes: Optional[int],
+           hits: int, misses: int, evictions: int) -> Dict[str, Any]:
+    lookups = hits + misses
+    return {
+        'entries': entries,
+        'bytes': size,
+        'max_entries': max_entries,
+        'max_bytes': max_bytes,
+        'hits': hits,
+        'misses': misses,
+        'evictions': evictions,
+        'hit_rate': hits / lookups if lookups > 0 else 0
+    }
+
+
+class NegativeCache:
+    def __init__(self, ttl: float = 30.0, max_ttl: float = 600.0, jitter: float = 0.2, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_ttl = max_ttl
+        self.jitter = jitter
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.additions = 0
+
+    def hit(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return False
+            self.hits += 1
+            return True
+
+    def add(self, key: Hashable):
+        with self._lock:
+            failures = self._entries.pop(key, (0.0, 0))[1] + 1
+            ttl = min(self.ttl * 2 ** (failures - 1), self.max_ttl)
+            ttl *= random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+            self._entries[key] = (time.monotonic() + ttl, failures)
+            self.additions += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'entries': sum(1 for expires, _ in self._entries.values() if expires > now),
+                'hits': self.hits,
+                'additions': self.additions
+            }
@@ -0,0 +1,134 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, Optional
+
+
+_MISSING = object()
+
+
+class SQLiteCache:
+    def __init__(self, cache_file: str = '.polyglotx_cache.sqlite3', ttl: Optional[float] = None,
+                 busy_timeout: float = 5.0, max_entries: Optional[int] = None, trim_interval: int = 1000):
+        self.cache_file = os.path.abspath(cache_file)
+        self.ttl = ttl
+        self.busy_timeout = busy_timeout
+        self.max_entries = max_entries
+        self.trim_interval = trim_interval
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+
+        connection = sqlite3.connect(self.cache_file, timeout=self.busy_timeout, isolation_level=None,
+                                     check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)'
+        )
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._connect().execute(
+            'SELECT value FROM translations WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (key, time.time())
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else time.time() + ttl
+        self._connect().execute(
+            'INSERT OR REPLACE INTO translations (key, value, expires) VALUES (?, ?, ?)',
+            (key, value, expires)
+        )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.trim_interval == 0
+        if due:
+            self.trim()
+
+    def delete(self, key: str):
+        self._connect().execute('DELETE FROM translations WHERE key = ?', (key,))
+
+    def purge_expired(self) -> int:
+        cursor = self._connect().execute(
+            'DELETE FROM translations WHERE expires IS NOT NULL AND expires <= ?', (time.time(),)
+        )
+        return cursor.rowcount
+
+    def trim(self) -> int:
+        removed = self.purge_expired()
+        if self.max_entries is not None:
+            excess = self.size() - self.max_entries
+            if excess > 0:
+                cursor = self._connect().execute(
+                    'DELETE FROM translations WHERE key IN '
+                    '(SELECT key FROM translations ORDER BY expires IS NOT NULL, expires LIMIT ?)',
+                    (excess,)
+                )
+                removed += cursor.rowcount
+        return removed
+
+    def clear(self):
+        self._connect().execute('DELETE FROM translations')
+
+    def size(self) -> int:
+        return self._connect().execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: str):
+        self.set(key, value)
+
+    def __delitem__(self, key: str):
+        self.delete(key)
+
+    def __contains__(self, key: str) -> bool:
+        row = self._connect().execute(
+            'SELECT 1 FROM translations WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (key, time.time())
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            'path': self.cache_file,
+            'entries': self.size(),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups > 0 else 0
+        }
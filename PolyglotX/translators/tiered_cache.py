@@ -0,0 +1,133 @@
+import os
+import queue
+import atexit
+import threading
+from typing import Dict, Any, Optional
+
+
+_MISSING = object()
+
+
+class TieredCache:
+    def __init__(self, l1: Any, l2: Optional[Any] = None, write_behind: bool = True):
+        self.l1 = l1
+        self.l2 = l2
+        self.write_behind = write_behind
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.write_errors = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer = None
+        atexit.register(self.flush)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_writer)
+
+    def _reset_writer(self):
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.l1.get(key, _MISSING)
+        if value is not _MISSING:
+            with self._lock:
+                self.l1_hits += 1
+            return value
+
+        if self.l2 is not None:
+            value = self.l2.get(key, _MISSING)
+            if value is not _MISSING:
+                self.l1[key] = value
+                with self._lock:
+                    self.l2_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def set(self, key: str, value: Any):
+        self.l1[key] = value
+        if self.l2 is None:
+            return
+        if not self.write_behind:
+            self.l2[key] = value
+            return
+        self._start_writer()
+        self._queue.put((key, value))
+
+    def _start_writer(self):
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._write_loop, name='polyglotx-cache-writer',
+                                                    daemon=True)
+                    self._writer.start()
+
+    def _write_loop(self):
+        pending = self._queue
+        while True:
+            key, value = pending.get()
+            try:
+                self.l2[key] = value
+            except Exception:
+                with self._lock:
+                    self.write_errors += 1
+            finally:
+                pending.task_done()
+
+    def flush(self):
+        if self._writer is not None:
+            self._queue.join()
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        value = self.l1.pop(key, default)
+        if self.l2 is not None and key in self.l2:
+            self.flush()
+            value = self.l2.get(key, default)
+            del self.l2[key]
+        return value
+
+    def clear(self):
+        self.flush()
+        self.l1.clear()
+        if self.l2 is not None:
+            self.l2.clear()
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        self.set(key, value)
+
+    def __delitem__(self, key: str):
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.l1 or (self.l2 is not None and key in self.l2)
+
+    def __len__(self) -> int:
+        return len(self.l2) if self.l2 is not None else len(self.l1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = {'l1': self.l1_hits, 'l2': self.l2_hits}
+            misses = self.misses
+            write_errors = self.write_errors
+        lookups = hits['l1'] + hits['l2'] + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': (hits['l1'] + hits['l2']) / lookups if lookups > 0 else 0,
+            'pending_writes': self._queue.qsize(),
+            'write_errors': write_errors,
+            'l1': self.l1.get_stats() if hasattr(self.l1, 'get_stats') else {'entries': len(self.l1)},
+            'l2': None if self.l2 is None else
+                  (self.l2.get_stats() if hasattr(self.l2, 'get_stats') else {'entries': len(self.l2)})
+        }
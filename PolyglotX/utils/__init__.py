@@ -1,5 +1,29 @@
-from PolyglotX.utils.helpers import *
-from PolyglotX.utils.decorators import *
-from PolyglotX.utils.validators import *
-from PolyglotX.utils.converters import *
-from PolyglotX.utils.analyzers import *
+from PolyglotX.utils.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    'PolyglotX.utils.helpers': [
+        'detect_language', 'extract_error_info', 'format_stack_trace',
+        'parse_exception', 'sanitize_error_message', 'get_error_context',
+        'calculate_error_hash', 'group_similar_errors', 'suggest_fixes',
+        'find_error_documentation'
+    ],
+    'PolyglotX.utils.decorators': [
+        'handle_exceptions', 'translate_errors', 'retry_on_error',
+        'fallback_on_error', 'log_exceptions', 'measure_exception_time',
+        'suppress_exceptions', 'transform_exception', 'notify_on_exception'
+    ],
+    'PolyglotX.utils.validators': [
+        'validate_language_code', 'validate_error_type', 'validate_translation',
+        'validate_config', 'validate_exception', 'validate_text_encoding'
+    ],
+    'PolyglotX.utils.converters': [
+        'exception_to_dict', 'exception_to_json', 'exception_to_yaml',
+        'traceback_to_list', 'traceback_to_string', 'error_dict_to_string',
+        'string_to_error_dict'
+    ],
+    'PolyglotX.utils.analyzers': ['ErrorAnalyzer', 'StackAnalyzer'],
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
@@ -3,6 +3,8 @@ import hashlib
 import traceback
 from typing import Dict, Any, List, Optional, Tuple
 from PolyglotX.core.language_detector import LanguageDetector
+from PolyglotX.core.knowledge_base import get_knowledge_base
+from PolyglotX.core.source_cache import get_source_cache
 
 
 def detect_language(text: str) -> Optional[str]:
@@ -47,21 +49,17 @@ def get_error_context(exc: Exception, lines_before: int = 3, lines_after: int =
     lineno = tb.tb_lineno
     filename = frame.f_code.co_filename
     
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-            start = max(0, lineno - lines_before - 1)
-            end = min(len(all_lines), lineno + lines_after)
-            context_lines = all_lines[start:end]
-            
-            return {
-                'filename': filename,
-                'lineno': lineno,
-                'context': context_lines,
-                'error_line': all_lines[lineno - 1] if 0 <= lineno - 1 < len(all_lines) else ''
-            }
-    except:
+    sources = get_source_cache()
+    context_lines = sources.get_context(filename, lineno, lines_before, lines_after)
+    if not context_lines:
         return {}
+    
+    return {
+        'filename': filename,
+        'lineno': lineno,
+        'context': context_lines,
+        'error_line': sources.get_line(filename, lineno)
+    }
 
 
 def calculate_error_hash(exc: Exception) -> str:
@@ -80,37 +78,7 @@ def group_similar_errors(errors: List[Exception]) -> Dict[str, List[Exception]]:
 
 
 def suggest_fixes(exc: Exception) -> List[str]:
-    exc_type = type(exc).__name__
-    
-    suggestions = {
-        'NameError': [
-            'Check if the variable is defined before use',
-            'Verify the spelling of the variable name',
-            'Ensure the variable is in the correct scope'
-        ],
-        'TypeError': [
-            'Check the types of arguments passed to the function',
-            'Verify the number of arguments matches the function signature',
-            'Ensure the object supports the operation'
-        ],
-        'ValueError': [
-            'Check if the value is in the expected range',
-            'Verify the format of the input value',
-            'Ensure the value is appropriate for the operation'
-        ],
-        'ImportError': [
-            'Check if the module is installed',
-            'Verify the module name is correct',
-            'Ensure the module is in PYTHONPATH'
-        ],
-        'FileNotFoundError': [
-            'Verify the file path is correct',
-            'Check if the file exists',
-            'Ensure you have read permissions'
-        ]
-    }
-    
-    return suggestions.get(exc_type, ['No specific suggestions available'])
+    return get_knowledge_base().entries('suggestions', exc) or ['No specific suggestions available']
 
 
 def find_error_documentation(exc: Exception) -> str:
@@ -0,0 +1,43 @@
+import sys
+import types
+import importlib
+from typing import Dict, List, Callable, Tuple, Any
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any):
+        shadowed = vars(self).get('_lazy_shadowed', {})
+        if isinstance(value, types.ModuleType) and shadowed.get(name) == value.__name__:
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+def lazy_exports(package: str, exports: Dict[str, List[str]]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    locations = {}
+    shadowed = {}
+    for module_name, names in exports.items():
+        for name in names:
+            locations[name] = module_name
+            if module_name == f"{package}.{name}":
+                shadowed[name] = module_name
+
+    if shadowed:
+        module = sys.modules[package]
+        module._lazy_shadowed = shadowed
+        module.__class__ = _LazyModule
+
+    def __getattr__(name: str) -> Any:
+        module_name = locations.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        parent, _, short_name = module_name.rpartition('.')
+        if short_name == name and parent in sys.modules:
+            setattr(sys.modules[parent], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(locations))
+
+    return __getattr__, __dir__
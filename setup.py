@@ -13,6 +13,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/6x-u/polyglotx",
     packages=find_packages(),
+    package_data={"PolyglotX": ["data/*.json"]},
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
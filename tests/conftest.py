@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from PolyglotX.translators import engine_registry
+from PolyglotX.translators.engine_registry import EngineRegistry
+from PolyglotX.translators.http_engines import EngineError
+
+
+def _translate(text):
+    return '\n'.join(f"<{line}>" for line in text.split('\n'))
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        text = parse_qs(urlparse(self.path).query)['q'][0]
+        self.server.record(self.client_address, text)
+        if self.path.startswith('/google'):
+            self._reply([[[_translate(text), text, None]], None, 'en'])
+        else:
+            self._reply({'responseData': {'translatedText': _translate(text)}})
+
+    def do_POST(self):
+        data = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.record(self.client_address, data['q'])
+        if isinstance(data['q'], list):
+            self._reply({'translatedText': [_translate(text) for text in data['q']]})
+        else:
+            self._reply({'translatedText': _translate(data['q'])})
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _StandInHandler)
+        self.delay = 0.0
+        self.texts = []
+        self.connections = set()
+        self._lock = threading.Lock()
+
+    def record(self, client_address, text):
+        with self._lock:
+            self.connections.add(client_address)
+            self.texts.append(text)
+        if self.delay:
+            time.sleep(self.delay)
+
+    @property
+    def requests(self):
+        with self._lock:
+            return len(self.texts)
+
+    def url(self, name):
+        return f"http://127.0.0.1:{self.server_address[1]}/{name}"
+
+
+def _offline(source, target):
+    raise EngineError('offline engine')
+
+
+@pytest.fixture
+def standin():
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registry(monkeypatch, standin):
+    monkeypatch.setenv('POLYGLOTX_CACHE_FILE', '')
+    registry = EngineRegistry(pool_size=4, timeout=5.0)
+    for name in ('google', 'mymemory', 'libre'):
+        registry.set_base_url(name, standin.url(name))
+    registry.register_engine('pons', _offline)
+    registry.register_engine('linguee', _offline)
+    monkeypatch.setattr(engine_registry, '_registry', registry)
+    return registry
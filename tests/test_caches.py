@@ -0,0 +1,85 @@
+import os
+
+from PolyglotX.translators.cache_manager import CacheManager
+from PolyglotX.translators.memory_cache import LRUCache, StripedLRUCache
+from PolyglotX.translators.sqlite_cache import SQLiteCache
+from PolyglotX.translators.tiered_cache import TieredCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache.get('a')
+    cache['c'] = 3
+
+    assert 'a' in cache and 'c' in cache
+    assert 'b' not in cache
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_striped_cache_respects_total_entries():
+    cache = StripedLRUCache(max_entries=4)
+    for index in range(20):
+        cache[index] = index
+
+    assert len(cache) == 4
+    assert cache.get_stats()['entries'] == 4
+    assert 19 in cache
+
+
+def test_striped_cache_respects_total_bytes():
+    cache = StripedLRUCache(max_entries=100, max_bytes=1000)
+    for index in range(20):
+        cache[f"key{index}"] = f"value{index}"
+
+    stats = cache.get_stats()
+    assert 0 < stats['entries'] < 20
+    assert stats['bytes'] <= 1000
+
+
+def test_cache_manager_skips_corrupt_records(tmp_path):
+    path = tmp_path / 'cache.json'
+    path.write_text(
+        '{"format": "polyglotx-cache", "version": 1}\n'
+        '{"k": "a", "v": 1}\n'
+        '[1, 2]\n'
+        '{broken\n'
+        '{"k": "b", "v": 2}\n'
+        '{"k": "c", "v"',
+        encoding='utf-8'
+    )
+
+    cache = CacheManager(str(path))
+
+    assert cache.cache == {'a': 1, 'b': 2}
+    assert cache.corrupt_records == 2
+    assert CacheManager(str(path)).cache == {'a': 1, 'b': 2}
+
+
+def test_sqlite_cache_trims_to_max_entries(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.sqlite3'), ttl=60, max_entries=10, trim_interval=25)
+    for index in range(50):
+        cache[f"key{index}"] = str(index)
+
+    assert cache.size() == 10
+    assert 'key49' in cache
+    assert 'key0' not in cache
+
+    cache.set('expired', 'x', ttl=-1)
+    assert 'expired' not in cache
+    cache.close()
+
+
+def test_tiered_cache_promotes_l2_hits(tmp_path):
+    l2 = SQLiteCache(str(tmp_path / 'cache.sqlite3'))
+    cache = TieredCache(LRUCache(), l2)
+    cache['greeting'] = 'hello'
+    cache.flush()
+
+    fresh = TieredCache(LRUCache(), l2)
+    assert fresh.get('greeting') == 'hello'
+    assert 'greeting' in fresh.l1
+    assert fresh.get_stats()['hits'] == {'l1': 0, 'l2': 1}
+    assert os.path.exists(l2.cache_file)
+    l2.close()
@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+
+def test_translations_reuse_one_connection(registry, standin):
+    client = registry.get_client('google', 'auto', 'it')
+
+    results = [client.translate(f"message {index}") for index in range(20)]
+
+    assert results[0] == '<message 0>'
+    assert standin.requests == 20
+    assert len(standin.connections) == 1
+    assert registry.pool.get_stats()['requests'] == 20
+
+
+def test_configure_pool_updates_existing_clients(registry):
+    google = registry.get_client('google', 'auto', 'it')
+    libre = registry.get_client('libre', 'auto', 'it')
+    registry.set_concurrency('libre', 2)
+
+    registry.configure_pool(pool_size=3)
+
+    assert google.get_stats()['max_concurrency'] == 3
+    assert google.max_idle == 3
+    assert libre.get_stats()['max_concurrency'] == 2
+    assert registry.get_client('mymemory', 'auto', 'it').get_stats()['max_concurrency'] == 3
+
+
+def test_configure_pool_timeout_bounds_requests(registry, standin):
+    client = registry.get_client('google', 'auto', 'it')
+    registry.configure_pool(timeout=0.2)
+    standin.delay = 1.0
+
+    start = time.monotonic()
+    with pytest.raises(Exception):
+        client.translate('slow message')
+
+    assert time.monotonic() - start < 0.9
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+from PolyglotX.translators.engine_health import EngineHealth
+from PolyglotX.translators.http_engines import EngineError, EngineInputError
+
+
+def test_breaker_opens_after_threshold_and_probes_once():
+    health = EngineHealth(failure_threshold=3, cooldown=0.0)
+    for _ in range(3):
+        health.record_failure(0.1)
+
+    assert health.state == EngineHealth.OPEN
+    assert health.allow()
+    assert not health.allow()
+
+    health.record_success(0.1)
+    assert health.state == EngineHealth.CLOSED
+
+
+def test_unmeasured_engines_rank_ahead_of_slow_ones(registry):
+    clients = registry.get_clients('auto', 'it')
+    registry.get_health('google').record_success(3.0)
+    registry.get_health('mymemory').record_success(0.2)
+
+    ranked = [name for name, _ in registry.rank_clients(clients)]
+
+    assert ranked[0] == 'mymemory'
+    assert ranked[-1] == 'google'
+
+
+def test_input_errors_do_not_open_the_circuit(registry, standin):
+    client = registry.get_client('mymemory', 'auto', 'it')
+    for _ in range(3):
+        with pytest.raises(EngineInputError):
+            client.translate('x' * 600)
+
+    assert client.health.state == EngineHealth.CLOSED
+    assert client.translate_batch(['y' * 600]) == [None]
+    assert client.health.state == EngineHealth.CLOSED
+    assert standin.requests == 0
+
+
+def test_budget_cuts_are_not_engine_failures(registry, standin):
+    client = registry.get_client('google', 'auto', 'it')
+    standin.delay = 0.5
+    for _ in range(4):
+        with pytest.raises(Exception):
+            client.translate('hello', 0.1)
+
+    assert client.health.state == EngineHealth.CLOSED
+    assert client.health.get_metrics()['failures'] == 0
+
+
+def test_slot_wait_is_bounded_by_the_deadline(registry, standin):
+    client = registry.get_client('google', 'auto', 'it')
+    client.set_concurrency(1)
+    standin.delay = 1.0
+    busy = threading.Thread(target=client.translate, args=('busy',))
+    busy.start()
+    time.sleep(0.2)
+
+    start = time.monotonic()
+    with pytest.raises(EngineError):
+        client.translate('hello', 0.2)
+
+    assert time.monotonic() - start < 0.6
+    assert client.health.get_metrics()['failures'] == 0
+    busy.join()
@@ -0,0 +1,51 @@
+import threading
+import time
+
+from PolyglotX.core.translator import Translator, MultiEngineTranslator
+
+
+def test_concurrent_misses_share_one_request(registry, standin):
+    translator = Translator('it')
+    standin.delay = 0.3
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(translator.translate('hello world')))
+               for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(results) == {'<hello world>'}
+    assert standin.requests == 1
+    assert translator.translate('hello world') == '<hello world>'
+    assert standin.requests == 1
+
+
+def test_value_only_messages_are_not_sent(registry, standin):
+    translator = Translator('it')
+
+    assert translator.translate("'k'") == "'k'"
+    assert translator.translate_many(["'k'", '42', '/tmp/module.py']) == ["'k'", '42', '/tmp/module.py']
+    assert standin.requests == 0
+
+
+def test_translate_many_batches_and_deduplicates(registry, standin):
+    translator = Translator('it')
+    texts = [f"message number {index % 10} here" for index in range(100)]
+
+    results = translator.translate_many(texts)
+
+    assert results[0] == '<message number 0 here>'
+    assert results[10] == results[0]
+    assert standin.requests == 1
+
+
+def test_consensus_timeout_bounds_the_fallback(registry, standin):
+    translator = MultiEngineTranslator('it')
+    standin.delay = 2.0
+
+    start = time.monotonic()
+    result = translator.translate_with_consensus('hello there friend', timeout=0.3)
+
+    assert result == 'hello there friend'
+    assert time.monotonic() - start < 1.0